@@ -1,19 +1,51 @@
 #!/usr/bin/env python3
 """Devtools for tutor-contrib-recon."""
 
+import os
+import re
+import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
-from functools import wraps
+from typing import Any, Callable, Optional
+from functools import lru_cache, wraps
 
 import click
 import cloup
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import tomlkit
+except ImportError:
+    tomlkit = None
+
 ## CONSTANTS ##
 
+PYPROJECT = "pyproject.toml"
+PYPROJECT_PATH = Path(__file__).parent / PYPROJECT
 MAIN_BRANCH = "main"
 DEV_BRANCH = "dev"
+BUMP_RULES = (
+    "major",
+    "minor",
+    "patch",
+    "premajor",
+    "preminor",
+    "prepatch",
+    "prerelease",
+)
+STDOUT_IS_TTY = sys.stdout.isatty()
+WRONG_BRANCH_STATUS = 3
+"""Exit status used by shell scripts which find themselves on the wrong branch."""
 PROGRAM_STYLED = click.style("dev.py", fg="green")
 HELP_EXAMPLE = PROGRAM_STYLED + click.style(" COMMAND --help", fg="yellow")
 PROJECT_STYLED = click.style("tutor-contrib-recon", fg="magenta")
@@ -44,17 +76,7 @@ version_and_tag_options = cloup.option_group(
         "--bump",
         help="Increment the version number prior to committing.",
         metavar="RULE",
-        type=cloup.Choice(
-            [
-                "major",
-                "minor",
-                "patch",
-                "premajor",
-                "preminor",
-                "prepatch",
-                "prerelease",
-            ]
-        ),
+        type=cloup.Choice(BUMP_RULES),
     ),
     cloup.option(
         "--tag/--no-tag",
@@ -82,11 +104,16 @@ commit_options = cloup.option_group(
     cloup.option(
         "--files",
         "--paths",
-        type=list,
-        help="The files and/or directories to add prior to committing.",
+        multiple=True,
+        help="The files and/or directories to add prior to committing. Can be given multiple times.",
         default=["."],
         metavar="PATHS",
     ),
+    cloup.option(
+        "--resolve-paths/--no-resolve-paths",
+        default=False,
+        help="Canonicalize the given paths (following symlinks) before adding them.",
+    ),
 )
 
 push_options = cloup.option_group(
@@ -108,13 +135,27 @@ code_style_options = cloup.option_group(
         default=True,
         help="Run 'black' on all sources prior to committing.",
     ),
+    cloup.option(
+        "--black-all/--black-changed",
+        default=False,
+        help="Format every source file rather than only changed and untracked ones.",
+    ),
 )
 
 
 ## OPTION GROUP HANDLERS ##
 
 
-def handle_release_and_tag(opts: "dict[str, Any]") -> None:
+def handle_release_and_tag(
+    opts: "dict[str, Any]",
+    pipeline: "Optional[list[list[str]]]" = None,
+    push_refs: "Optional[list[str]]" = None,
+) -> None:
+    """Bump, commit and tag the version as requested.
+
+    If `push_refs` is given, a tag to be pushed is appended to it rather than pushed
+    immediately, so that it can go out together with the branch.
+    """
     bump, tag, push_tag, tag_message = map(
         opts.pop, ("bump", "tag", "push_tag", "tag_message")
     )
@@ -122,35 +163,70 @@ def handle_release_and_tag(opts: "dict[str, Any]") -> None:
     if bump:
         bump_version(bump)
         current_version = get_version()
-        git_add(["pyproject.toml"])
-        git_commit(f"[dev bot] Bump to v{current_version}.")
+        git_add_and_commit(
+            [str(PYPROJECT_PATH)],
+            f"[dev bot] Bump to v{current_version}.",
+            pipeline=pipeline,
+        )
     if tag:
         if not tag_message:
             tag_message = f"tutor-contrib-recon v{current_version}"
-        new_tag = git_tag(tag_message)
-        if push_tag:
-            git_push(new_tag)
-
-
-def handle_push(opts: "dict[str, Any]") -> None:
+        new_tag = git_tag(tag_message, pipeline=pipeline)
+        if not push_tag:
+            return
+        if push_refs is None:
+            git_push(new_tag, pipeline=pipeline)
+        else:
+            push_refs.append(new_tag)
+
+
+def handle_push(
+    opts: "dict[str, Any]",
+    branch: Optional[str] = None,
+    refs: "Optional[list[str]]" = None,
+) -> None:
+    """Push the current branch (or `branch`) along with any other `refs` in one `git push`."""
     push, set_upstream = map(opts.pop, ("push", "set_upstream"))
+    refs = list(refs or ())
     if push:
-        git_push(set_upstream=set_upstream)
+        refs.insert(0, branch if branch is not None else get_git_branch())
+    if not refs:
+        return
+    git_push(*refs, set_upstream=push and set_upstream)
 
 
-def handle_black(opts: "dict[str, Any]") -> None:
-    black = opts.pop("black")
-    if black:
-        run_black()
-
+def handle_black(
+    opts: "dict[str, Any]", snapshots: "Optional[dict[Path, bytes]]" = None
+) -> None:
+    """Run black right away, if requested.
 
-def handle_commit(opts: "dict[str, Any]") -> None:
-    commit, message, files = map(opts.pop, ("commit", "message", "files"))
+    If `snapshots` is given, the original contents of the files black may touch are
+    recorded in it first, so that they can be restored should a later step fail.
+    """
+    black, black_all = map(opts.pop, ("black", "black_all"))
+    if not black:
+        return
+    files = tracked_py_files() if black_all else changed_py_files()
     if not files:
-        files = ["."]
+        emit("No .py changes; skipping black.")
+        return
+    if snapshots is not None:
+        snapshots.update((Path(f), Path(f).read_bytes()) for f in files)
+    run_black(None if black_all else files)
+
+
+def handle_commit(
+    opts: "dict[str, Any]", pipeline: "Optional[list[list[str]]]" = None
+) -> None:
+    commit, message, files, resolve_paths = map(
+        opts.pop, ("commit", "message", "files", "resolve_paths")
+    )
+    files = list(files) or ["."]
+    if resolve_paths:
+        files = [os.path.realpath(f) for f in files]
     if commit:
-        git_add(files)
-        git_commit(message)
+        git_add(files, pipeline=pipeline)
+        git_commit(message, pipeline=pipeline)
 
 
 ## DECORATORS ##
@@ -166,9 +242,10 @@ def assert_all_options_handled(func):
     @wraps(func)
     def dec(*args, **kwargs) -> Any:
         func(*args, opts=kwargs)
-        assert (
-            not kwargs
-        ), f"Some keyword arguments were not consumed by {func.__name__}: {kwargs.keys()}"
+        if __debug__:
+            assert (
+                not kwargs
+            ), f"Some keyword arguments were not consumed by {func.__name__}: {kwargs.keys()}"
 
     return dec
 
@@ -189,10 +266,24 @@ def dev():
 @assert_all_options_handled
 def publish(opts) -> None:
     """Check your changes into version control. Also formats your code and pushes it to the configured remote by default."""
-    handle_black(opts)
-    handle_release_and_tag(opts)
-    handle_commit(opts)
-    handle_push(opts)
+    pipeline, push_refs = [], []
+    branch = None
+    snapshots: "dict[Path, bytes]" = {}
+    if opts["bump"]:
+        # Warm the version cache while the branch is looked up.
+        _, branch = parallel(get_version, get_git_branch)
+    try:
+        # Format first, so that a failing black leaves the version untouched.
+        handle_black(opts, snapshots)
+        if opts["bump"]:
+            snapshots[PYPROJECT_PATH] = PYPROJECT_PATH.read_bytes()
+        handle_release_and_tag(opts, pipeline, push_refs)
+        handle_commit(opts, pipeline)
+        run_pipeline(pipeline)
+    except CommandFailure:
+        restore_uncommitted(snapshots)
+        raise
+    handle_push(opts, branch=branch, refs=push_refs)
 
 
 @dev.command()
@@ -202,10 +293,19 @@ def publish(opts) -> None:
 def new_feature(opts) -> None:
     """Create a new feature branch based on origin/dev."""
     name = opts.pop("branch_name")
-    ensure_on_branch(DEV_BRANCH)
-    git_checkout(name, new=True)
-    git_fetch("dev")
-    git_rebase("dev", remote=True)
+    # Check the branch, create the new one and rebase it in a single shell.
+    dev_branch = shlex.quote(DEV_BRANCH)
+    completed_process = run_script(
+        f'[ "$(git rev-parse --abbrev-ref HEAD)" = {dev_branch} ] || exit {WRONG_BRANCH_STATUS}; '
+        f"git checkout -b {shlex.quote(name)} && git pull --rebase origin {dev_branch}",
+        error_on_fail=False,
+    )
+    if completed_process.returncode == WRONG_BRANCH_STATUS:
+        wrong_branch_exit(DEV_BRANCH)
+    elif completed_process.returncode:
+        raise CommandFailure(
+            completed_process.returncode, f"Could not create feature branch {name}."
+        )
     handle_push(opts)
 
 
@@ -243,6 +343,23 @@ def error_exit(return_code: int = 1, message: str = "") -> None:
     sys.exit(return_code)
 
 
+_USE_POSIX_SPAWN = getattr(subprocess, "_USE_POSIX_SPAWN", False)
+_FD_KWARGS = frozenset(("close_fds", "pass_fds", "preexec_fn"))
+_executables: "dict[str, str]" = {}
+
+
+def which(name: str) -> str:
+    """Return the full path of the executable `name`, or `name` itself if it can't be found.
+
+    Lookups are cached, so $PATH is only searched once per executable.
+    """
+    try:
+        return _executables[name]
+    except KeyError:
+        path = _executables[name] = shutil.which(name) or name
+        return path
+
+
 def run(
     arg_list: "list[str]",
     error_on_fail: bool = True,
@@ -254,10 +371,18 @@ def run(
 
     *args and **kwargs are passed to `subprocess.run`.
     """
+    if _USE_POSIX_SPAWN and not _FD_KWARGS.intersection(kwargs):
+        # Descriptors opened by Python are non-inheritable anyway; leaving them alone
+        # lets subprocess use posix_spawn instead of fork + exec.
+        kwargs["close_fds"] = False
     if echo:
-        cmd_str = click.style(" ".join(arg_list), fg="yellow")
+        cmd_str = shlex.join(arg_list)
+        if STDOUT_IS_TTY:
+            cmd_str = click.style(cmd_str, fg="yellow")
         emit(f"Running: {cmd_str}")
-    completed_process = subprocess.run(arg_list, *args, **kwargs)
+    completed_process = subprocess.run(
+        [which(arg_list[0]), *arg_list[1:]], *args, **kwargs
+    )
     if error_on_fail and completed_process.returncode:
         raise CommandFailure(
             completed_process.returncode, f"Command {arg_list} failed."
@@ -265,59 +390,238 @@ def run(
     return completed_process
 
 
+def run_or_defer(
+    arg_list: "list[str]", pipeline: "Optional[list[list[str]]]" = None
+) -> None:
+    """Run the command in `arg_list` now, or append it to `pipeline` if one is given.
+
+    Deferred commands are executed together by `run_pipeline`.
+    """
+    if pipeline is None:
+        run(arg_list)
+    else:
+        pipeline.append(arg_list)
+
+
+def run_pipeline(steps: "list[list[str]]") -> None:
+    """Run each command in `steps` in order within a single shell, stopping at the first failure.
+
+    This spawns one process for the whole sequence rather than one per command.
+    """
+    if steps:
+        run_script(" && ".join(shlex.join(step) for step in steps))
+
+
+def run_script(script: str, error_on_fail: bool = True) -> subprocess.CompletedProcess:
+    """Echo `script`, then run it with bash in a single process."""
+    emit(f"Running: {click.style(script, fg='yellow') if STDOUT_IS_TTY else script}")
+    completed_process = subprocess.run(script, shell=True, executable=which("bash"))
+    # Scripts may switch branches.
+    get_git_branch.cache_clear()
+    if error_on_fail and completed_process.returncode:
+        raise CommandFailure(
+            completed_process.returncode, f"Command {script!r} failed."
+        )
+    return completed_process
+
+
+def parallel(*callables: Callable[[], Any]) -> "list[Any]":
+    """Call each of `callables` concurrently and return their results in order.
+
+    Intended for independent, I/O-bound work such as read-only git queries.
+    """
+    with ThreadPoolExecutor(max_workers=len(callables)) as executor:
+        futures = [executor.submit(c) for c in callables]
+        return [f.result() for f in futures]
+
+
 ## MISC HELPER FUNCTIONS ##
 
 
-def run_black() -> None:
-    """Run `black` on all sources."""
-    run(["black", str(Path(".").resolve())])
+def run_black(
+    files: "Optional[list[str]]" = None,
+    pipeline: "Optional[list[list[str]]]" = None,
+) -> None:
+    """Run `black` on `files`, or on all sources if no files are given."""
+    run_or_defer(["black", *(files or ["."])], pipeline)
 
 
-def get_version() -> None:
-    return run(
-        ["poetry", "version", "--short", "--no-ansi", "--no-interaction"],
-        capture_output=True,
-        text=True,
-    ).stdout.strip()
+_version_epoch = 0
+"""Incremented whenever the project version changes, invalidating `get_version`'s cache."""
+
+
+def get_version() -> str:
+    """Return the current project version, re-reading it only after `bump_version` is called."""
+    return _get_version(_version_epoch)
+
+
+@lru_cache(maxsize=1)
+def _get_version(epoch: int) -> str:
+    if tomllib is None:
+        return run(
+            ["poetry", "version", "--short", "--no-ansi", "--no-interaction"],
+            echo=False,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    return load_pyproject(epoch)["tool"]["poetry"]["version"]
+
+
+@lru_cache(maxsize=1)
+def load_pyproject(epoch: int) -> "dict[str, Any]":
+    """Parse this project's pyproject.toml, which is cached until the version is bumped.
+
+    Requires `tomllib` (or `tomli`). Callers should treat the result as read-only.
+    """
+    with open(PYPROJECT_PATH, "rb") as f:
+        return tomllib.load(f)
+
+
+_VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:(a|b|rc)(\d+))?$")
+
+_BUMP_RULES = {
+    "major": lambda M, m, p, pre: (
+        (M, 0, 0, None) if pre and not (m or p) else (M + 1, 0, 0, None)
+    ),
+    "minor": lambda M, m, p, pre: (
+        (M, m, 0, None) if pre and not p else (M, m + 1, 0, None)
+    ),
+    "patch": lambda M, m, p, pre: (M, m, p, None) if pre else (M, m, p + 1, None),
+    "premajor": lambda M, m, p, pre: (M + 1, 0, 0, ("a", 0)),
+    "preminor": lambda M, m, p, pre: (M, m + 1, 0, ("a", 0)),
+    "prepatch": lambda M, m, p, pre: (M, m, p + 1, ("a", 0)),
+    "prerelease": lambda M, m, p, pre: (
+        (M, m, p, (pre[0], pre[1] + 1)) if pre else (M, m, p + 1, ("a", 0))
+    ),
+}
+"""Maps each bump rule to a transform of `(major, minor, patch, prerelease)`, following Poetry's semantics."""
+assert _BUMP_RULES.keys() == set(BUMP_RULES)
+
+
+def _apply_bump(version: str, rule: str) -> str:
+    """Return `version` bumped according to `rule`.
+
+    Raises:
+        ValueError: If `version` is not of the form `X.Y.Z` with an optional `a`/`b`/`rc` prerelease.
+    """
+    match = _VERSION_PATTERN.match(version)
+    if not match:
+        raise ValueError(f"Cannot bump unrecognized version '{version}'.")
+    major, minor, patch, pre_tag, pre_num = match.groups()
+    pre = (pre_tag, int(pre_num)) if pre_tag else None
+    major, minor, patch, pre = _BUMP_RULES[rule](
+        int(major), int(minor), int(patch), pre
+    )
+    new_version = f"{major}.{minor}.{patch}"
+    if pre:
+        new_version += f"{pre[0]}{pre[1]}"
+    return new_version
 
 
 def bump_version(rule: str) -> None:
-    """Bump the project version according to `rule` (major, minor, patch, premajor, etc.)."""
-    run(["poetry", "version", rule])
+    """Bump the project version according to `rule` (major, minor, patch, premajor, etc.).
+
+    The new version is written directly to pyproject.toml when `tomlkit` is available;
+    otherwise this falls back to `poetry version`.
+    """
+    global _version_epoch
+    current_version = get_version()
+    try:
+        new_version = _apply_bump(current_version, rule)
+    except ValueError:
+        new_version = None
+    if tomlkit is None or new_version is None:
+        run(["poetry", "version", rule])
+    else:
+        pyproject = tomlkit.parse(PYPROJECT_PATH.read_text())
+        pyproject["tool"]["poetry"]["version"] = new_version
+        PYPROJECT_PATH.write_text(tomlkit.dumps(pyproject))
+        emit(f"Bumping version from {current_version} to {new_version}.")
+    _version_epoch += 1
+
+
+def restore_uncommitted(snapshots: "dict[Path, bytes]") -> None:
+    """Write back the original contents of each file in `snapshots` which has changed since.
+
+    Files whose current content has already been committed are left alone. Used to undo
+    formatting and version bumps when a later step of `publish` fails, so that the tree is
+    as it was before and retrying doesn't e.g. bump the version twice.
+    """
+    global _version_epoch
+    for path, contents in snapshots.items():
+        if path.read_bytes() == contents:
+            continue
+        status = run(
+            ["git", "status", "--porcelain", "--", str(path)],
+            echo=False,
+            capture_output=True,
+        ).stdout
+        if not status:
+            continue  # Committed as is.
+        path.write_bytes(contents)
+        if path == PYPROJECT_PATH:
+            _version_epoch += 1
+            emit(f"Restored {PYPROJECT} to version {get_version()}.")
+        else:
+            emit(f"Restored {path}.")
 
 
 def bump_and_commit(rule: str) -> None:
     """Bump the version according to the rule, then add and commit pyproject.toml."""
     emit(f"Bumping the {rule} version.")
     bump_version(rule)
-    git_add(["pyproject.toml"])
-    git_commit(f"[dev bot] Bump to v{get_version()}.")
+    git_add_and_commit([str(PYPROJECT_PATH)], f"[dev bot] Bump to v{get_version()}.")
 
 
 ## GIT HELPER FUNCTIONS ##
 
 
-def git_add(files: "list[str]") -> None:
-    run(["git", "add"] + files)
+def git_add(files: "list[str]", pipeline: "Optional[list[list[str]]]" = None) -> None:
+    run_or_defer(["git", "add"] + files, pipeline)
 
 
-def git_commit(message: str = "") -> None:
+def git_commit(message: str = "", pipeline: "Optional[list[list[str]]]" = None) -> None:
     cmd = ["git", "commit"]
     if message:
         cmd += ["-m", message]
-    run(cmd)
+    run_or_defer(cmd, pipeline)
+
+
+def git_add_and_commit(
+    files: "list[str]",
+    message: str = "",
+    pipeline: "Optional[list[list[str]]]" = None,
+) -> None:
+    """Stage and commit `files` with a single `git commit -- <files>`.
+
+    Only suitable for files which are already tracked; use `git_add` followed by
+    `git_commit` for anything else.
+    """
+    cmd = ["git", "commit"]
+    if message:
+        cmd += ["-m", message]
+    run_or_defer(cmd + ["--"] + files, pipeline)
 
 
 def git_push(
-    id: Optional[str] = None, set_upstream: bool = False, remote_name="origin"
+    *refs: str,
+    set_upstream: bool = False,
+    remote_name="origin",
+    pipeline: "Optional[list[list[str]]]" = None,
 ) -> None:
-    if id is None:
-        id = get_git_branch()
+    """Push `refs` (by default, the current branch) to the remote.
+
+    Several refs are pushed atomically in a single round trip.
+    """
+    if not refs:
+        refs = (get_git_branch(),)
     cmd = ["git", "push"]
+    if len(refs) > 1:
+        cmd += ["--atomic"]
     if set_upstream:
         cmd += ["--set-upstream"]
-    cmd += [remote_name, id]
-    run(cmd)
+    cmd += [remote_name, *refs]
+    run_or_defer(cmd, pipeline)
 
 
 def git_fetch(branch_name: str, remote_name: str = "origin") -> None:
@@ -336,24 +640,51 @@ def git_rebase(
         cmd += [remote_name]
     cmd += [branch_name]
     run(cmd)
+    get_git_branch.cache_clear()
+
+
+def git_pull_rebase(
+    branch_name: str,
+    remote_name: str = "origin",
+    pipeline: "Optional[list[list[str]]]" = None,
+) -> None:
+    """Fetch `branch_name` from the remote and rebase the current branch onto it in one step."""
+    run_or_defer(
+        ["git", "pull", "--rebase", "--no-edit", remote_name, branch_name], pipeline
+    )
+    get_git_branch.cache_clear()
+
+
+def git_pull_ff_only(
+    branch_name: str,
+    remote_name: str = "origin",
+    pipeline: "Optional[list[list[str]]]" = None,
+) -> None:
+    """Fast-forward the current branch to `branch_name` on the remote, failing if it has diverged."""
+    run_or_defer(["git", "pull", "--ff-only", remote_name, branch_name], pipeline)
 
 
-def git_tag(message: str = "") -> str:
+def git_tag(message: str = "", pipeline: "Optional[list[list[str]]]" = None) -> str:
     """Create a git tag named with the current version number."""
     tag = f"v{get_version()}"
+    if git_query("-q", "--verify", f"refs/tags/{tag}", error_on_fail=False):
+        raise CommandFailure(message=f"Tag {tag} already exists.")
     cmd = ["git", "tag", "-a", tag]
     if message:
         cmd += ["-m", message]
-    run(cmd)
+    run_or_defer(cmd, pipeline)
     return tag
 
 
-def git_checkout(branch_name: str, new: bool = False) -> None:
+def git_checkout(
+    branch_name: str, new: bool = False, pipeline: "Optional[list[list[str]]]" = None
+) -> None:
     cmd = ["git", "checkout"]
     if new:
         cmd.append("-b")
     cmd.append(branch_name)
-    run(cmd)
+    run_or_defer(cmd, pipeline)
+    get_git_branch.cache_clear()
 
 
 def git_branch(*args) -> None:
@@ -362,54 +693,120 @@ def git_branch(*args) -> None:
     run(cmd)
 
 
-def git_merge(*args) -> None:
+def git_merge(*args, pipeline: "Optional[list[list[str]]]" = None) -> None:
     cmd = ["git", "merge"]
     cmd += args
-    run(cmd)
+    run_or_defer(cmd, pipeline)
 
 
+@lru_cache(maxsize=1)
 def get_git_branch() -> str:
-    return run(
-        ["git", "symbolic-ref", "--short", "HEAD"],
+    """Return the name of the current branch, or the commit SHA if HEAD is detached."""
+    sha, branch = git_query("HEAD", "--abbrev-ref", "HEAD")
+    return sha if branch == "HEAD" else branch
+
+
+def git_query(*args: str, error_on_fail: bool = True) -> "list[str]":
+    """Run `git rev-parse` with `args` and return its output lines.
+
+    Several queries can be answered by one process by passing them all at once, e.g.
+    `git_query("--show-toplevel", "--abbrev-ref", "HEAD")`.
+    """
+    output = run(
+        ["git", "rev-parse", *args],
+        error_on_fail=error_on_fail,
+        echo=False,
+        capture_output=True,
+    ).stdout
+    return output.decode().splitlines()
+
+
+def changed_py_files() -> "list[str]":
+    """Return the Python files which are modified, added or untracked in the working tree."""
+    status = run(
+        ["git", "status", "--porcelain", "-z", "--untracked-files=all", "--", "*.py"],
         echo=False,
         capture_output=True,
         text=True,
-    ).stdout.strip()
+    ).stdout
+    entries = iter(status.split("\0"))
+    files = []
+    for entry in entries:
+        if not entry:
+            continue
+        code, path = entry[:2], entry[3:]
+        if code[0] in "RC":
+            next(entries)  # Skip the rename/copy source.
+        if "D" not in code:
+            files.append(path)
+    return files
+
+
+def tracked_py_files() -> "list[str]":
+    """Return the Python files which are tracked or untracked (but not ignored) in the working tree."""
+    output = run(
+        [
+            "git",
+            "ls-files",
+            "-z",
+            "--cached",
+            "--others",
+            "--exclude-standard",
+            "--",
+            "*.py",
+        ],
+        echo=False,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [path for path in output.split("\0") if path and os.path.exists(path)]
+
 
+def ensure_on_branch(branch_name: str, current: Optional[str] = None) -> str:
+    """Exit with an error if not on the given branch; return the current branch's name.
 
-def ensure_on_branch(branch_name: str) -> str:
-    """Exit with an error if not on the given branch; return the current branch's name."""
-    current = get_git_branch()
+    `current` may be given to skip looking up the current branch.
+    """
+    if current is None:
+        current = get_git_branch()
     if current != branch_name:
-        error_exit(
-            f"You must be on the '{branch_name}' branch to run this command. Check it out first, then try again."
-        )
+        wrong_branch_exit(branch_name)
     return current
 
 
-def ensure_not_on_branches(*branch_names: str) -> str:
-    """Exit with an error if on one of the given branches; return the current branch's name otherwise."""
-    current = get_git_branch()
+def wrong_branch_exit(branch_name: str) -> None:
+    error_exit(
+        f"You must be on the '{branch_name}' branch to run this command. Check it out first, then try again."
+    )
+
+
+def ensure_not_on_branches(*branch_names: str, current: Optional[str] = None) -> str:
+    """Exit with an error if on one of the given branches; return the current branch's name otherwise.
+
+    `current` may be given to skip looking up the current branch.
+    """
+    if current is None:
+        current = get_git_branch()
     if current in branch_names:
         error_exit(f"This action cannot be performed from branch {current}.")
     return current
 
 
 def merge_feature_to_dev():
-    """Rebase the current feature branch off of dev then checkout dev and merge the feature branch."""
-    git_fetch(DEV_BRANCH)
+    """Rebase the current feature branch onto origin/dev, then bring dev up to date and squash the feature branch into it."""
     feature_branch = ensure_not_on_branches(MAIN_BRANCH, DEV_BRANCH)
-    emit(f"Rebasing {feature_branch} onto dev.")
-    git_rebase(DEV_BRANCH)
-    emit("Checking out dev.")
-    git_checkout(DEV_BRANCH)
     emit(
-        f"Squashing and merging {feature_branch} into dev. Please describe the change in the text editor that appears."
+        f"Rebasing {feature_branch} onto origin/dev, then fast-forwarding dev and squashing {feature_branch} into it."
     )
-    git_merge("--squash", feature_branch)
-    emit(f"Finished merge.")
-    git_add(["."])
-    git_commit(f"Squash and merge {feature_branch} into dev.")
+    pipeline = []
+    git_pull_rebase(DEV_BRANCH, pipeline=pipeline)
+    git_checkout(DEV_BRANCH, pipeline=pipeline)
+    # Without this, upstream commits missing from a stale local dev would be folded into the squash.
+    git_pull_ff_only(DEV_BRANCH, pipeline=pipeline)
+    git_merge("--squash", feature_branch, pipeline=pipeline)
+    git_add(["."], pipeline=pipeline)
+    git_commit(f"Squash and merge {feature_branch} into dev.", pipeline=pipeline)
+    run_pipeline(pipeline)
     emit(f"Created commit.")
     push_cmd = click.style("git push", fg="yellow")
     delete_cmd = click.style(f"git branch -d {feature_branch}", fg="yellow")
@@ -426,8 +823,7 @@ def release_no_merge():
 
     NOTE: Planned for future use. Function can be called manually via interactive shell if needed for now.
     """
-    git_fetch(MAIN_BRANCH)
-    git_rebase(MAIN_BRANCH)
+    git_pull_rebase(MAIN_BRANCH)
     git_push(f"{DEV_BRANCH}:{MAIN_BRANCH}")
 
 
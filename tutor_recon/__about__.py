@@ -1,8 +1,44 @@
 import re
+from functools import lru_cache
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+_TABLE_RE = re.compile(r"^\[", re.MULTILINE)
+
+
+def _version_from_toml(toml_text: str, toml_header: str) -> str:
+    """Return the 'version' key of the table `toml_header` in `toml_text`.
+
+    Uses a real TOML parser when one is available, and otherwise scans only the lines of the
+    requested table.
+    """
+    if tomllib is not None:
+        table = tomllib.loads(toml_text)
+        for key in toml_header.strip("[]").split("."):
+            table = table[key]
+        return table["version"]
+    start = toml_text.find(f"{toml_header}\n")
+    if start == -1:
+        raise KeyError(toml_header)
+    start += len(toml_header)
+    end_match = _TABLE_RE.search(toml_text, start)
+    end = end_match.start() if end_match else len(toml_text)
+    match = _VERSION_RE.search(toml_text, start, end)
+    if not match:
+        raise KeyError("version")
+    return match.group(1)
+
 
+@lru_cache(maxsize=None)
 def project_version(toml_header="[tool.poetry]"):
     """Get the version number of the root module in which this function resides.
 
@@ -29,16 +65,14 @@ def project_version(toml_header="[tool.poetry]"):
     try:
         ver = version(mainname)
     except PackageNotFoundError:
-        toml_header = re.escape(toml_header)
         depth = len(qualname) - 1
-        with open(Path(__file__).parents[depth] / "pyproject.toml", "r") as pyproj:
+        pyproject = Path(__file__).parents[depth] / "pyproject.toml"
+        with open(pyproject, "r") as pyproj:
             toml_text = pyproj.read()
-        match = re.search(
-            rf'^{toml_header}$[^^\[]*^version = "([^"]+)"$', toml_text, re.MULTILINE
-        )
-        if not match:
+        try:
+            ver = _version_from_toml(toml_text, toml_header)
+        except KeyError:
             raise KeyError("No version specification was found in pyproject.toml.")
-        ver = match.group(1)
     return ver
 
 
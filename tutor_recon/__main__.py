@@ -0,0 +1,25 @@
+"""Run recon as `python -m tutor_recon [ARGS]`, equivalent to `tutor recon [ARGS]`.
+
+`--version` is answered without importing Tutor or the CLI. Everything else is handed
+to Tutor, which supplies the context (e.g. the project root) that recon's commands need.
+Use the `TUTOR_ROOT` environment variable to select a project root.
+"""
+
+import sys
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if argv in (["--version"], ["-V"]):
+        from tutor_recon.__about__ import __version__
+
+        print(__version__)
+        return
+    from tutor.commands.cli import main as tutor_main
+
+    sys.argv = ["tutor", "recon", *argv]
+    tutor_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Shared helpers for defining the Recon CLI."""
+
+from importlib import import_module
+from typing import List, Mapping, Optional
+
+import click
+import cloup
+
+
+class LazyGroup(cloup.Group):
+    """A command group which only imports a subcommand's module once that subcommand is needed.
+
+    Keyword Arguments:
+        lazy_subcommands: Maps each subcommand's name to the (relative) module defining it.
+            Each module must expose its command as `command`.
+        lazy_package: The package relative to which `lazy_subcommands` are imported.
+        lazy_help: Maps subcommand names to the short help shown in the group's help page.
+            Subcommands listed here aren't imported just to render that page.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Mapping[str, str] = {},
+        lazy_package: Optional[str] = None,
+        lazy_help: Mapping[str, str] = {},
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_package = lazy_package
+        self.lazy_subcommands = dict(lazy_subcommands)
+        self.lazy_help = dict(lazy_help)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(self.lazy_subcommands.keys() | set(super().list_commands(ctx)))
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, name)
+        if command is None and name in self.lazy_subcommands:
+            module = import_module(
+                self.lazy_subcommands[name], package=self.lazy_package
+            )
+            command = module.command
+            self.add_command(command, name)  # Cached for any later lookups.
+        return command
+
+    def list_sections(
+        self, ctx: click.Context, include_default_section: bool = True
+    ) -> List[cloup.Section]:
+        # Help needs every subcommand's description. Unloaded subcommands with a
+        # `lazy_help` entry are described by a bare stub; the rest are loaded.
+        stubs = {}
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                continue
+            if name in self.lazy_help:
+                stubs[name] = click.Command(name, help=self.lazy_help[name])
+            else:
+                self.get_command(ctx, name)
+        sections = super().list_sections(ctx, include_default_section=False)
+        if not include_default_section:
+            return sections
+        # Only public API is used to find the default section: it is the one extra
+        # section listed when asked to include it (if it has any commands).
+        commands = dict(stubs)
+        with_default = super().list_sections(ctx)
+        if len(with_default) > len(sections):
+            commands.update(with_default[-1].commands)
+        if commands:
+            title = "Other commands" if sections else "Commands"
+            sections.append(cloup.Section.sorted(title, commands=commands))
+        return sections
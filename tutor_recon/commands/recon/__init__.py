@@ -1,28 +1,38 @@
 """The Recon CLI definition."""
 
 import cloup
-from importlib import import_module
 
+from tutor_recon.commands import LazyGroup
 from tutor_recon.util.constants import CONTEXT_SETTINGS, PROGRAM_DESCRIPTION
 from tutor_recon.__about__ import __version__
 
-SUBCOMMANDS = (
-    ".module",
-    ".init",
-    ".list_",
-    ".printroot",
-    ".replace_template",
-    ".save",
-)
+SUBCOMMANDS = {
+    "module": ".module",
+    "init": ".init",
+    "list": ".list_",
+    "printroot": ".printroot",
+    "replace-template": ".replace_template",
+    "save": ".save",
+}
+
+SUBCOMMAND_HELP = {
+    "module": "Create, download, or update a recon module.",
+    "init": "Initialize recon.",
+    "list": "Print the current recon configuration as JSON.",
+    "printroot": "Echo the location of the config overrides directory over stdout.",
+    "replace-template": "Scaffold an override of a tutor template in its entirety.",
+    "save": "Apply all override settings to the rendered environment.",
+}
+"""Each subcommand's short help, which its command also uses, so that the two can't drift apart."""
 
 
 @cloup.group(
+    cls=LazyGroup,
+    lazy_subcommands=SUBCOMMANDS,
+    lazy_package=__package__,
+    lazy_help=SUBCOMMAND_HELP,
     context_settings=CONTEXT_SETTINGS,
     help=PROGRAM_DESCRIPTION,
 )
 def recon():
     pass
-
-
-for subcommand in SUBCOMMANDS:
-    recon.add_command(import_module(subcommand, package=__package__).command)
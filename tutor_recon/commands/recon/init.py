@@ -1,15 +1,13 @@
 from pathlib import Path
 
-import click
 import cloup
 
-from tutor_recon.override.main import scaffold_all
-from tutor_recon.util.cli import emit
+from tutor_recon.util.cli import emit, style
 from tutor_recon.util.paths import overrides_path
-from tutor_recon.util.tutor import run_tutor_config_save
+from tutor_recon.commands.recon import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Initialize recon.")
+@cloup.command(help=SUBCOMMAND_HELP["init"])
 @cloup.option(
     "--env-dir",
     help="The path to your environment override files. Defaults to '$(tutor config printroot)/env_overrides'.",
@@ -24,12 +22,14 @@ from tutor_recon.util.tutor import run_tutor_config_save
 )
 @cloup.pass_context
 def init(context: cloup.Context, env_dir, tutor):
+    from tutor_recon.override.main import scaffold_all
+    from tutor_recon.util.tutor import run_tutor_config_save
+
     tutor_root = Path(context.obj.root)
-    recon_root = overrides_path(tutor_root=tutor_root, env_dir=env_dir).resolve()
-    if tutor:
-        run_tutor_config_save(context)
-    scaffold_all(tutor_root, recon_root)
-    recon_root_str = click.style(str(recon_root), fg="magenta")
+    recon_root = overrides_path(tutor_root=tutor_root, env_dir=env_dir)
+    prerendered = run_tutor_config_save(context, recon_root) if tutor else None
+    scaffold_all(tutor_root, recon_root, prerendered=prerendered)
+    recon_root_str = style(recon_root, fg="magenta")
     emit(
         f"You're all set! Your environment overrides can be configured at {recon_root_str} 👍"
     )
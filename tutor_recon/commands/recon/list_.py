@@ -1,18 +1,17 @@
 """The Recon CLI definitions."""
 
+import sys
 
 import cloup
 from cloup.constraints import mutually_exclusive
 
 
-from tutor_recon.override.main import main_config
-from tutor_recon.override.module import OverrideModule
-from tutor_recon.override.sequence import OverrideSequence
-from tutor_recon.util import vjson
+from tutor_recon.util.constants import MODULES_SUBDIR
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Print the current recon configuration as JSON.", name="list")
+@cloup.command(help=SUBCOMMAND_HELP["list"], name="list")
 @cloup.option_group(
     "Output data options",
     cloup.option(
@@ -56,20 +55,27 @@ def list_(
     claims: bool,
     module: "list[str]",
 ):
+    from tutor_recon.override.main import main_config
+    from tutor_recon.override.module import OverrideModule
+    from tutor_recon.override.sequence import OverrideSequence
+    from tutor_recon.util import vjson
+
     _, recon_root = root_dirs(context)
-    sequence = main_config(recon_root)
-    modules_root = recon_root / "modules"
     if module:
+        modules_root = recon_root / MODULES_SUBDIR
         sequence = OverrideSequence(
             [OverrideModule.by_name(name, modules_root) for name in module]
         )
+    else:
+        sequence = main_config(recon_root)
     if claims:
-        config_str = vjson.dumps({".".join(k): v for k, v in sequence.claims.items()})
+        chunks = vjson.iterdumps({".".join(k): v for k, v in sequence.claims.items()})
     else:
-        config_str = vjson.dumps(
+        chunks = vjson.iterdumps(
             sequence, expand_remote_mappings=(not no_expand), location=recon_root
         )
-    print(config_str)
+    sys.stdout.writelines(chunks)
+    sys.stdout.write("\n")
 
 
 command = list_
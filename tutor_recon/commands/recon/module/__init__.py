@@ -1,26 +1,39 @@
 """The Recon CLI definition."""
 
 import cloup
-from importlib import import_module
-
-SUBCOMMANDS = (
-    ".add",
-    ".remove",
-    ".new",
-    ".update",
-    ".disable",
-    ".restore",
-)
+
+from tutor_recon.commands import LazyGroup
+from tutor_recon.commands.recon import SUBCOMMAND_HELP as RECON_SUBCOMMAND_HELP
+
+SUBCOMMANDS = {
+    "add": ".add",
+    "remove": ".remove",
+    "new": ".new",
+    "update": ".update",
+    "disable": ".disable",
+    "enable": ".restore",
+}
+
+SUBCOMMAND_HELP = {
+    "add": "Clone a remote override module.",
+    "remove": "Disable (if applicable) and remove a module.",
+    "new": "Create a new override module with the given name.",
+    "update": "Update an installed override module.",
+    "disable": "Disable the module with the given name.",
+    "enable": "Enable a module which has already been downloaded.",
+}
+"""Each subcommand's short help, which its command also uses, so that the two can't drift apart."""
 
 
 @cloup.group(
-    help="Create, download, or update a recon module.",
+    cls=LazyGroup,
+    lazy_subcommands=SUBCOMMANDS,
+    lazy_package=__package__,
+    lazy_help=SUBCOMMAND_HELP,
+    help=RECON_SUBCOMMAND_HELP["module"],
 )
 def module():
     pass
 
 
-for subcommand in SUBCOMMANDS:
-    module.add_command(import_module(subcommand, package=__package__).command)
-
 command = module
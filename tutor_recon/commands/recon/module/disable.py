@@ -2,23 +2,19 @@
 
 import cloup
 
-from tutor_recon.override.main import main_config
-from tutor_recon.override.module import OverrideModule
 from tutor_recon.util.cli import emit
 from tutor_recon.util.paths import root_dirs
-from tutor_recon.util.vjson import expand_references
+from tutor_recon.commands.recon.module import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Disable the module with the given name.")
+@cloup.command(help=SUBCOMMAND_HELP["disable"])
 @cloup.argument("name")
 @cloup.pass_context
 def disable(context: cloup.Context, name: str):
+    from tutor_recon.util.module import disable_module
+
     _, recon_root = root_dirs(context)
-    modules_root = recon_root / "modules"
-    module = OverrideModule.by_name(name, modules_root)
-    main = main_config(recon_root)
-    main.remove_where(**expand_references(module.to_object()))
-    main.save(recon_root / "main.v.json")
+    disable_module(recon_root, name)
     emit(f"Disabled module '{name}'.")
 
 
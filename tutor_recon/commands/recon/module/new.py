@@ -5,16 +5,13 @@ from pathlib import Path
 import cloup
 
 
-from tutor_recon.override.main import main_config
-from tutor_recon.override.reference import OverrideReference
-from tutor_recon.override.module import OverrideModule
 from tutor_recon.util.cli import emit
-from tutor_recon.util.module import init_repo
+from tutor_recon.util.constants import MODULES_SUBDIR
 from tutor_recon.util.paths import root_dirs
-from tutor_recon.util.vjson.reference import RemoteMapping
+from tutor_recon.commands.recon.module import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Create a new override module with the given name.")
+@cloup.command(help=SUBCOMMAND_HELP["new"])
 @cloup.option(
     "--git-url",
     metavar="URL",
@@ -38,11 +35,16 @@ from tutor_recon.util.vjson.reference import RemoteMapping
 def new(
     context: cloup.Context, name: str, git_url: str, initialize_repo: bool, push: bool
 ):
+    from tutor_recon.override.main import main_config_session
+    from tutor_recon.override.reference import OverrideReference
+    from tutor_recon.override.module import OverrideModule
+    from tutor_recon.util.module import init_repo
+    from tutor_recon.util.vjson.reference import RemoteMapping
+
     _, recon_root = root_dirs(context)
-    modules_root = recon_root / Path("modules")
-    module_root = Path("modules") / name
+    modules_root = recon_root / MODULES_SUBDIR
+    module_root = Path(MODULES_SUBDIR) / name
     target = module_root / "module.v.json"
-    main = main_config(recon_root)
     module = OverrideModule.from_object(
         RemoteMapping(
             remote_reference=target,
@@ -53,8 +55,8 @@ def new(
         )
     )
     reference = OverrideReference(module)
-    main.add_override(reference)
-    main.save(recon_root / "main.v.json")
+    with main_config_session(recon_root) as main:
+        main.add_override(reference)
     if initialize_repo:
         init_repo(parent_dir=modules_root, name=name, url=git_url, push=push)
     emit(
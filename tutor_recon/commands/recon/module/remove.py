@@ -3,20 +3,21 @@
 import cloup
 
 from tutor_recon.util.cli import emit
-
-from .disable import disable
-
-from tutor_recon.util.module import remove_module
+from tutor_recon.util.constants import MODULES_SUBDIR
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon.module import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Disable (if applicable) and remove a module.")
+@cloup.command(help=SUBCOMMAND_HELP["remove"])
 @cloup.argument("name")
 @cloup.pass_context
 def remove(context: cloup.Context, name: str):
+    from tutor_recon.util.module import disable_module, remove_module
+
     _, recon_root = root_dirs(context)
-    modules_root = recon_root / "modules"
-    context.invoke(disable, name=name)
+    modules_root = recon_root / MODULES_SUBDIR
+    disable_module(recon_root, name)
+    emit(f"Disabled module '{name}'.")
     remove_module(modules_root=modules_root, name=name)
     emit(f"Removed module '{name}'.")
 
@@ -2,22 +2,24 @@
 
 import cloup
 
-from tutor_recon.override.main import main_config
-from tutor_recon.util.module import get_reference
 from tutor_recon.util.cli import emit
+from tutor_recon.util.constants import MODULES_SUBDIR
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon.module import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Enable a module which has already been downloaded.")
+@cloup.command(help=SUBCOMMAND_HELP["enable"])
 @cloup.argument("name")
 @cloup.pass_context
 def enable(context: cloup.Context, name: str):
+    from tutor_recon.override.main import main_config_session
+    from tutor_recon.util.module import get_reference
+
     _, recon_root = root_dirs(context)
-    modules_root = recon_root / "modules"
+    modules_root = recon_root / MODULES_SUBDIR
     reference = get_reference(modules_root=modules_root, name=name)
-    main = main_config(recon_root)
-    main.add_override(reference)
-    main.save(recon_root / "main.v.json")
+    with main_config_session(recon_root) as main:
+        main.add_override(reference)
     emit(f"Successfully enabled {name}.")
 
 
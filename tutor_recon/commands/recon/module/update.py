@@ -1,34 +1,31 @@
 """The Recon CLI definitions."""
 
 
-import click
 import cloup
 
 
-from tutor_recon.override.main import main_config
-from tutor_recon.util.cli import emit
-from tutor_recon.util.module import (
-    load_info,
-    pull_repo,
-)
+from tutor_recon.util.cli import emit, style
+from tutor_recon.util.constants import MODULES_SUBDIR
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon.module import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Update an installed override module.")
+@cloup.command(help=SUBCOMMAND_HELP["update"])
 @cloup.argument("name")
 @cloup.pass_context
 def update(context: cloup.Context, name: str):
+    from tutor_recon.util.module import (
+        load_info,
+        pull_repo,
+    )
+
     _, recon_root = root_dirs(context)
-    module_path = recon_root / "modules" / name
+    module_path = recon_root / MODULES_SUBDIR / name
     prev_info = load_info(module_dir=module_path)
-    pull_repo(loc=module_path)
-    new_info = load_info(module_dir=module_path)
-    main = main_config(recon_root)
-    main.save(recon_root / "main.v.json")
+    changed, _ = pull_repo(loc=module_path)
+    new_info = load_info(module_dir=module_path) if changed else prev_info
     prev_version, new_version = prev_info["version"], new_info["version"]
-    emit(
-        f"Updated {click.style(name, 'magenta')} from {prev_version} to {new_version}."
-    )
+    emit(f"Updated {style(name, fg='magenta')} from {prev_version} to {new_version}.")
 
 
 command = update
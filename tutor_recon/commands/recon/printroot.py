@@ -5,13 +5,14 @@ import click
 import cloup
 
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Echo the location of the config overrides directory over stdout.")
+@cloup.command(help=SUBCOMMAND_HELP["printroot"])
 @cloup.pass_context
 def printroot(context: cloup.Context):
     _, recon_root = root_dirs(context)
-    click.echo(recon_root.resolve())
+    click.echo(recon_root)
 
 
 command = printroot
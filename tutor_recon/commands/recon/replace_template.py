@@ -2,34 +2,34 @@
 
 from pathlib import Path
 
-import click
 import cloup
 
 
-from tutor_recon.override.main import main_config
-from tutor_recon.override.template import TemplateOverride
-from tutor_recon.util.cli import emit
+from tutor_recon.util.cli import emit, style
 from tutor_recon.util.constants import (
-    RECON_SAVE_STYLED,
+    recon_save_styled,
 )
 from tutor_recon.util.paths import root_dirs
+from tutor_recon.commands.recon import SUBCOMMAND_HELP
 
 
-@cloup.command(help="Scaffold an override of a tutor template in its entirety.")
+@cloup.command(help=SUBCOMMAND_HELP["replace-template"])
 @cloup.argument("path", metavar="PATH_RELATIVE_TO_ENV")
 @cloup.pass_context
 def replace_template(context: cloup.Context, path: str):
+    from tutor_recon.override.main import main_config_session
+    from tutor_recon.override.template import TemplateOverride
+
     tutor_root, recon_root = root_dirs(context)
-    main = main_config(recon_root)
     override = TemplateOverride.for_template(Path(path))
-    main.add_override(override)
-    override.scaffold(tutor_root, recon_root)
-    main.save(recon_root / "main.v.json")
-    path_styled = click.style(str(path), fg="blue")
-    override_styled = click.style(str(recon_root / override.src), fg="magenta")
+    with main_config_session(recon_root) as main:
+        main.add_override(override)
+        override.scaffold(tutor_root, recon_root)
+    path_styled = style(path, fg="blue")
+    override_styled = style(recon_root / override.src, fg="magenta")
     emit(f"Scaffolded {path_styled} at {override_styled} 👍")
     emit(
-        f"Change the file to your heart's content, then it will be rendered when you run {RECON_SAVE_STYLED}."
+        f"Change the file to your heart's content, then it will be rendered when you run {recon_save_styled()}."
     )
 
 
@@ -1,16 +1,17 @@
 """The OverrideConfig class and subclass definitions."""
 
-import json
+import os
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
 from tutor_recon.util.misc import flatten_dict
 
-from tutor_recon.util.vjson.util import (
-    recursive_update,
-    set_nested,
-    walk_dict,
-)
-from tutor_recon.util import vjson
+from tutor_recon.util.vjson.util import is_hollow, map_leaves, recursive_update
+from tutor_recon.util import serialization, vjson
+from tutor_recon.util.paths import atomic_write
 
 from tutor_recon.override.tutor import update_config, get_complete
 from tutor_recon.override.override import OverrideMixin
@@ -19,6 +20,8 @@ from tutor_recon.override.override import OverrideMixin
 class OverrideConfig(OverrideMixin, metaclass=ABCMeta):
     """A settings-like override configuration object."""
 
+    __slots__ = ("overrides", "target")
+
     def __init__(self, overrides: vjson.VJSON_T, target: Path, **kwargs) -> None:
         super().__init__(**kwargs)
         self.overrides = overrides
@@ -34,10 +37,11 @@ class OverrideConfig(OverrideMixin, metaclass=ABCMeta):
         )
 
     @abstractmethod
-    def load_from_env(self, tutor_root: Path) -> dict:
+    def load_from_env(self, tutor_root: Path) -> Mapping:
         """Load this configuration's settings from the current Tutor environment.
 
         Ideally all possible keys should be present along with their current or default values.
+        The result may be shared with other callers, so it must not be mutated.
         """
 
     @abstractmethod
@@ -46,30 +50,20 @@ class OverrideConfig(OverrideMixin, metaclass=ABCMeta):
 
     def to_object(self) -> dict:
         obj = super().to_object()
-        obj.update(
-            {
-                "overrides": self.overrides,
-                "target": self.target,
-            }
-        )
+        obj["overrides"] = self.overrides
+        obj["target"] = self.target
         return obj
 
     def scaffold(self, tutor_root: Path, recon_root: Path) -> None:
-        recursive_update(self.overrides, self.get_complete(tutor_root))
+        _fill_unset(self.overrides, self.load_from_env(tutor_root))
 
     def get_scaffold(self, tutor_root: Path) -> dict:
         """Return a dict mapping (all) possible keys for this config to `'$default'`."""
-        env = self.load_from_env(tutor_root)
-        ret = dict()
-        for key_list, value in walk_dict(env):
-            set_nested(ret, key_list, vjson.format_unset(value))
-        return ret
+        return map_leaves(self.load_from_env(tutor_root), vjson.format_unset)
 
     def get_complete(self, tutor_root: Path) -> "list[dict]":
         """Return the full scaffold of this Config with all overrides applied."""
-        scaffold = self.get_scaffold(tutor_root)
-        recursive_update(scaffold, self.overrides)
-        return scaffold
+        return _complete_of(self.load_from_env(tutor_root), self.overrides)
 
     def override(self, tutor_root: Path, recon_root: Path) -> None:
         """Apply `self.overrides` to the environment."""
@@ -77,30 +71,103 @@ class OverrideConfig(OverrideMixin, metaclass=ABCMeta):
 
 
 class TutorOverrideConfig(OverrideConfig):
+    __slots__ = ()
     type_id = "tutor"
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-    def load_from_env(self, tutor_root: Path) -> dict:
-        return get_complete(tutor_root).copy()
+    def load_from_env(self, tutor_root: Path) -> Mapping:
+        return MappingProxyType(get_complete(tutor_root))
 
     def update_env(self, tutor_root: Path, override_settings: dict) -> None:
         update_config(tutor_root, settings=vjson.expand_references(override_settings))
 
 
 class JSONOverrideConfig(OverrideConfig):
+    __slots__ = ()
     type_id = "json"
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-    def load_from_env(self, tutor_root: Path) -> dict:
-        with open(tutor_root / self.target, "r") as f:
-            return json.load(f)
+    def load_from_env(self, tutor_root: Path) -> Mapping:
+        """Return the parsed target file, shared between callers until the file changes."""
+        path = tutor_root / self.target
+        stat = os.stat(path)
+        return MappingProxyType(
+            _load_json(path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        )
 
     def update_env(self, tutor_root: Path, override_settings: dict) -> None:
-        env = self.load_from_env(tutor_root)
+        """Apply `override_settings` to the target file.
+
+        The file is rendered by Tutor and read by the platform rather than edited by hand,
+        so it's written compactly. (Override files in the recon root stay indented.)
+        """
+        path = tutor_root / self.target
+        source = path.read_bytes()
+        env = serialization.loads(source)  # Private, as it's updated in place.
         recursive_update(env, override_settings)
-        with open(tutor_root / self.target, "w") as f:
-            json.dump(env, f, indent=4)
+        data = serialization.dumps_bytes(env)
+        if data != source:
+            atomic_write(path, data)
+            _load_json.cache_clear()
+
+
+def _fill_unset(mapping: Mapping, env: Mapping) -> None:
+    """Add an unset placeholder to `mapping` for each terminal value of `env` which it is missing.
+
+    Hollow entries in `mapping` are filled too. This is done without first building a full
+    scaffold of `env`.
+    """
+    for key, value in env.items():
+        if type(value) is dict or isinstance(value, Mapping):
+            if key not in mapping:
+                sub_scaffold = map_leaves(value, vjson.format_unset)
+                if sub_scaffold:
+                    mapping[key] = sub_scaffold
+                continue
+            child = mapping[key]
+            if type(child) is dict or isinstance(child, Mapping):
+                _fill_unset(child, value)
+        elif key not in mapping or is_hollow(mapping[key]):
+            mapping[key] = vjson.format_unset(value)
+
+
+def _complete_of(env: Mapping, overrides: Mapping) -> dict:
+    """Equivalent to updating `map_leaves(env, format_unset)` with `overrides`, in a single pass."""
+    ret = dict()
+    for key, value in env.items():
+        is_mapping = type(value) is dict or isinstance(value, Mapping)
+        if is_mapping and is_hollow(value):
+            continue  # Not in the scaffold, so any override is added after the rest.
+        if key in overrides:
+            override = overrides[key]
+            if type(override) is not dict and not isinstance(override, Mapping):
+                ret[key] = override
+                continue
+            sub_complete = _complete_of(value if is_mapping else {}, override)
+            if sub_complete:
+                ret[key] = sub_complete
+            elif not is_mapping:
+                ret[key] = vjson.format_unset(value)
+        elif is_mapping:
+            ret[key] = map_leaves(value, vjson.format_unset)
+        else:
+            ret[key] = vjson.format_unset(value)
+    for key, override in overrides.items():
+        if key in env and not is_hollow(env[key]):
+            continue
+        if type(override) is dict or isinstance(override, Mapping):
+            sub_complete = _complete_of({}, override)
+            if sub_complete:
+                ret[key] = sub_complete
+        else:
+            ret[key] = override
+    return ret
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: Path, mtime_ns: int, size: int, inode: int) -> dict:
+    return serialization.loads(path.read_bytes())
@@ -1,20 +1,76 @@
+import os
+
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator, Optional
 
 from tutor_recon.override.sequence import OverrideSequence
+from tutor_recon.override.tutor import prime_complete
 
 
 def main_config(recon_root: Path) -> OverrideSequence:
+    """Load the main config under `recon_root`, or the default sequence if there is none.
+
+    The parsed config is memoized on the file's modification time, so commands which
+    invoke one another (e.g. `remove` -> `disable`) share a single parse. Callers which
+    mutate the returned object are expected to save it, which invalidates the cache.
+    """
     main_path = recon_root / "main.v.json"
-    if main_path.exists():
-        return OverrideSequence.load(main_path)
-    return OverrideSequence.default(recon_root)
+    try:
+        mtime_ns = os.stat(main_path).st_mtime_ns
+    except FileNotFoundError:
+        return _default_main_config(recon_root)
+    return _load_main_config(main_path, mtime_ns)
 
 
-def scaffold_all(tutor_root: Path, recon_root: Path) -> None:
+@contextmanager
+def main_config_session(recon_root: Path) -> Iterator[OverrideSequence]:
+    """Context manager yielding the main config, which is saved on a clean exit."""
     main = main_config(recon_root)
-    main.scaffold(tutor_root, recon_root)
+    try:
+        yield main
+    except BaseException:
+        # Don't hand out the partially mutated config from the cache.
+        clear_main_config_cache()
+        raise
     main.save(to=recon_root / "main.v.json")
 
 
-def override_all(tutor_root: Path, recon_root: Path) -> None:
+def clear_main_config_cache() -> None:
+    """Forget every main config memoized by `main_config`."""
+    _load_main_config.cache_clear()
+    _default_main_config.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_main_config(main_path: Path, mtime_ns: int) -> OverrideSequence:
+    return OverrideSequence.load(main_path)
+
+
+@lru_cache(maxsize=4)
+def _default_main_config(recon_root: Path) -> OverrideSequence:
+    return OverrideSequence.default(recon_root)
+
+
+def scaffold_all(
+    tutor_root: Path, recon_root: Path, prerendered: Optional[dict] = None
+) -> None:
+    """Scaffold every override in the main config.
+
+    `prerendered` may be given as the complete Tutor configuration if it is already in
+    memory (e.g. as returned by `run_tutor_config_save`), so that it isn't loaded again.
+    """
+    if prerendered is not None:
+        prime_complete(tutor_root, prerendered)
+    with main_config_session(recon_root) as main:
+        main.scaffold(tutor_root, recon_root)
+
+
+def override_all(
+    tutor_root: Path, recon_root: Path, prerendered: Optional[dict] = None
+) -> None:
+    """Apply every override in the main config; see `scaffold_all` for `prerendered`."""
+    if prerendered is not None:
+        prime_complete(tutor_root, prerendered)
     main_config(recon_root).override(tutor_root, recon_root)
@@ -4,12 +4,14 @@ from pathlib import Path
 from typing import MutableMapping
 
 from tutor_recon.util import vjson
+from tutor_recon.util.constants import MODULES_SUBDIR
 from .sequence import OverrideSequence
 
 
 class OverrideModule(OverrideSequence):
     """A namespaced OverrideSequence."""
 
+    __slots__ = ("info",)
     type_id = "override-module"
 
     def __init__(self, info: MutableMapping, **kwargs) -> None:
@@ -24,9 +26,10 @@ class OverrideModule(OverrideSequence):
     def override(self, tutor_root: Path, recon_root: Path) -> None:
         """Call `apply_module_hook()` on each override then apply overrides normally."""
         module_id = self.info["name"]
+        module_root = recon_root / MODULES_SUBDIR / module_id
         for override in self.overrides:
             override.apply_module_hook(
-                module_root=recon_root / "modules" / module_id,
+                module_root=module_root,
                 module_id=module_id,
                 tutor_root=tutor_root,
                 recon_root=recon_root,
@@ -6,6 +6,8 @@ from tutor_recon.util import vjson
 
 
 class OverrideMixin(vjson.VJSONSerializableMixin, metaclass=ABCMeta):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
@@ -7,6 +7,7 @@ from tutor_recon.override.override import (
 
 
 class OverrideReference(OverrideMixin):
+    __slots__ = ("referenced_override",)
     type_id = "override-reference"
 
     def __init__(self, override: OverrideMixin, **kwargs) -> None:
@@ -19,7 +20,7 @@ class OverrideReference(OverrideMixin):
 
     def to_object(self) -> dict:
         obj = super().to_object()
-        obj.update({"override": self.referenced_override.to_object()})
+        obj["override"] = self.referenced_override.to_object()
         return obj
 
     def scaffold(self, tutor_root: Path, recon_root: Path) -> None:
@@ -7,12 +7,13 @@ from tutor_recon.util import vjson
 from tutor_recon.override.override import (
     OverrideMixin,
 )
-from tutor_recon.util.constants import DEFAULT_OVERRIDE_SEQUENCE
+from tutor_recon.util.constants import DEFAULT_OVERRIDE_SEQUENCE_OBJECT
 
 
 class OverrideSequence(OverrideMixin):
     """A sequence of override objects which are applied in order."""
 
+    __slots__ = ("overrides",)
     type_id = "override-sequence"
 
     def __init__(
@@ -23,7 +24,7 @@ class OverrideSequence(OverrideMixin):
 
     @classmethod
     def default(cls, recon_root: Path) -> "OverrideSequence":
-        return vjson.loads(DEFAULT_OVERRIDE_SEQUENCE, location=recon_root)
+        return vjson.load_object(DEFAULT_OVERRIDE_SEQUENCE_OBJECT, location=recon_root)
 
     @property
     def claims(self) -> None:
@@ -41,7 +42,19 @@ class OverrideSequence(OverrideMixin):
         for override in self.overrides:
             override.scaffold(tutor_root, recon_root)
 
+    def save(self, to: Path, **kwargs) -> None:
+        super().save(to, **kwargs)
+        from tutor_recon.override.main import clear_main_config_cache
+
+        clear_main_config_cache()
+
     def add_override(self, override: OverrideMixin) -> None:
+        """Append `override`, dropping any identical override which it would supersede anyway.
+
+        This keeps e.g. enabling a module twice from applying all of its overrides twice.
+        """
+        obj = override.to_object()
+        self.overrides = [o for o in self.overrides if o.to_object() != obj]
         self.overrides.append(override)
 
     def override(self, tutor_root: Path, recon_root: Path) -> None:
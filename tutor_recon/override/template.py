@@ -8,6 +8,7 @@ from tutor_recon.override.override import OverrideMixin
 
 
 class TemplateOverride(OverrideMixin):
+    __slots__ = ("_src", "_effective_src", "dest")
     type_id = "template"
 
     def __init__(self, src: vjson.VJSON_T, dest: Path, **kwargs) -> None:
@@ -49,12 +50,8 @@ class TemplateOverride(OverrideMixin):
 
     def to_object(self) -> dict:
         obj = super().to_object()
-        obj.update(
-            {
-                "src": self._src,
-                "dest": self.dest,
-            }
-        )
+        obj["src"] = self._src
+        obj["dest"] = self.dest
         return obj
 
     @classmethod
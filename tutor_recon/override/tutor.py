@@ -1,9 +1,11 @@
 """Retrieve environment information from Tutor."""
 
+import os
 import pkg_resources
+from functools import lru_cache
 from pathlib import Path
 
-from tutor.config import load_no_check, save_config_file, merge
+from tutor.config import config_path, load_no_check, save_config_file, merge
 from tutor.config import load_all as tutor_load_all
 from tutor.env import Renderer
 
@@ -27,14 +29,49 @@ def get_possible_keys() -> "list[str]":
 
 
 def get_current(tutor_root: Path) -> dict:
-    """Retrieve all Tutor configuration values which are currently set."""
-    current, _ = load_all(tutor_root)
+    """Retrieve all Tutor configuration values which are currently set.
+
+    The result is memoized on the modification time, size and inode of the Tutor config file
+    and shared between callers, which must not mutate it.
+    """
+    root = str(tutor_root.resolve())
+    try:
+        stat = os.stat(config_path(root))
+    except FileNotFoundError:
+        current, _ = load_all(tutor_root)
+        return current
+    return _load_current(root, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@lru_cache(maxsize=4)
+def _load_current(root: str, mtime_ns: int, size: int, inode: int) -> dict:
+    current, _ = tutor_load_all(root)
     return current
 
 
+_complete: "dict[Path, dict]" = {}
+"""Complete configurations by resolved Tutor root, valid until the Tutor config is next updated."""
+
+
+def prime_complete(tutor_root: Path, config: dict) -> None:
+    """Use `config` as the result of `get_complete(tutor_root)` until the Tutor config is next updated.
+
+    This spares a re-read of the configuration which was just rendered by `tutor config save`.
+    """
+    _complete[tutor_root.resolve()] = config
+
+
 def get_complete(tutor_root: Path) -> dict:
-    """Retrive the environment as it stands, including defaults and substitutions, from Tutor."""
-    return load_no_check(tutor_root)
+    """Retrive the environment as it stands, including defaults and substitutions, from Tutor.
+
+    The result is loaded once per Tutor root and shared between callers, which must not mutate it.
+    """
+    root = tutor_root.resolve()
+    try:
+        return _complete[root]
+    except KeyError:
+        config = _complete[root] = load_no_check(str(root))
+        return config
 
 
 def tutor_scaffold(tutor_root: Path) -> dict:
@@ -50,6 +87,9 @@ def update_config(tutor_root: Path, settings: dict) -> None:
     current = get_current(tutor_root)
     merge(settings, current, force=True)
     save_config_file(tutor_root, settings)
+    # A rewrite within the same mtime tick could otherwise go unnoticed by `get_current`.
+    _load_current.cache_clear()
+    _complete.pop(tutor_root.resolve(), None)
 
 
 def template_source(template_relpath: Path) -> Path:
@@ -1,6 +1,5 @@
 import os
 import pkg_resources
-from glob import glob
 
 from tutor_recon.__about__ import __version__
 from tutor_recon.commands.recon import recon
@@ -15,11 +14,12 @@ hooks = {}
 def patches():
     all_patches = {}
     patches_dir = pkg_resources.resource_filename("tutor_recon", "patches")
-    for path in glob(os.path.join(patches_dir, "*")):
-        with open(path) as patch_file:
-            name = os.path.basename(path)
-            content = patch_file.read()
-            all_patches[name] = content
+    with os.scandir(patches_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            with open(entry.path) as patch_file:
+                all_patches[entry.name] = patch_file.read()
     return all_patches
 
 
@@ -6,7 +6,17 @@ from typing import IO, Optional
 
 import click
 
-PLUGIN_STYLED = click.style("recon", fg="magenta")
+STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+
+def style(text, **styles) -> str:
+    """Like `click.style()`, but only apply styles if stdout is a terminal."""
+    if not STDOUT_IS_TTY:
+        return str(text)
+    return click.style(text, **styles)
+
+
+PLUGIN_STYLED = style("recon", fg="magenta")
 PLUGIN_TAG = f"[{PLUGIN_STYLED}]"
 
 
@@ -1,8 +1,10 @@
-import json
+from functools import lru_cache
 
 import click
 import cloup
 
+from .cli import style
+
 MAIN_COLOR = cloup.Color.bright_blue
 ACCENT_COLOR = cloup.Color.magenta
 EXTERNAL_COLOR = cloup.Color.yellow
@@ -15,6 +17,9 @@ PROGRAM_DESCRIPTION = f"""
 Use {HELP_EXAMPLE} for help with a particular subcommand.
 """
 
+MODULES_SUBDIR = "modules"
+"""The directory under the recon root in which modules are stored."""
+
 CONTEXT_SETTINGS = cloup.Context.settings(
     formatter_settings=cloup.HelpFormatter.settings(
         max_width=160,
@@ -27,28 +32,35 @@ CONTEXT_SETTINGS = cloup.Context.settings(
     ),
 )
 
-CONFIG_SAVE_STYLED = click.style("tutor config save", fg=EXTERNAL_COLOR)
-RECON_SAVE_STYLED = click.style("tutor recon save", fg=MAIN_COLOR)
-
-DEFAULT_OVERRIDE_SEQUENCE = json.dumps(
-    {
-        "$t": "override-sequence",
-        "overrides": [
-            {
-                "$t": "tutor",
-                "target": "config.yml",
-                "overrides": "$./tutor_config.v.json",
-            },
-            {
-                "$t": "json",
-                "target": "env/apps/openedx/config/cms.env.json",
-                "overrides": "$./openedx/cms.env.v.json",
-            },
-            {
-                "$t": "json",
-                "target": "env/apps/openedx/config/lms.env.json",
-                "overrides": "$./openedx/lms.env.v.json",
-            },
-        ],
-    }
-)
+
+@lru_cache(maxsize=None)
+def config_save_styled() -> str:
+    return style("tutor config save", fg=EXTERNAL_COLOR)
+
+
+@lru_cache(maxsize=None)
+def recon_save_styled() -> str:
+    return style("tutor recon save", fg=MAIN_COLOR)
+
+
+DEFAULT_OVERRIDE_SEQUENCE_OBJECT = {
+    "$t": "override-sequence",
+    "overrides": [
+        {
+            "$t": "tutor",
+            "target": "config.yml",
+            "overrides": "$./tutor_config.v.json",
+        },
+        {
+            "$t": "json",
+            "target": "env/apps/openedx/config/cms.env.json",
+            "overrides": "$./openedx/cms.env.v.json",
+        },
+        {
+            "$t": "json",
+            "target": "env/apps/openedx/config/lms.env.json",
+            "overrides": "$./openedx/lms.env.v.json",
+        },
+    ],
+}
+"""The main config used when there is none on disk, as a parsed JSON object."""
@@ -1,8 +1,11 @@
 """Miscellaneous utility functions."""
 
-from typing import Any, Hashable, Iterator, MutableMapping, Optional
+from typing import Any, Callable, Hashable, Iterator, MutableMapping, Optional
 from typing import Mapping, Sequence
 
+# Types which are never mappings, so `isinstance(value, Mapping)` needn't be consulted for them.
+_TERMINAL_TYPES = frozenset((str, int, float, bool, type(None), list))
+
 
 def brief(string: str, max_len=20) -> str:
     """Shorten the given string to a maximum length using elipses."""
@@ -29,7 +32,9 @@ def walk_dict(
     key_prefix = [] if key_prefix is None else key_prefix
     for k, v in mapping.items():
         key_seq = key_prefix + [k]
-        if isinstance(v, Mapping):
+        if type(v) is dict or (
+            type(v) not in _TERMINAL_TYPES and isinstance(v, Mapping)
+        ):
             yield from walk_dict(v, key_prefix=key_seq)
         else:
             yield key_seq, v
@@ -50,13 +55,53 @@ def set_nested(mapping: Mapping, key_sequence: Sequence[str], value: Any) -> Non
         set_nested(mapping[first], rest, value)
 
 
+def map_leaves(mapping: Mapping, fn: Callable[[Any], Any]) -> dict:
+    """Copy the nested `mapping` as dicts, replacing each terminal value `v` with `fn(v)`.
+
+    As with `walk_dict`, empty sub-mappings have no terminal values and are left out.
+    """
+    ret = dict()
+    for key, value in mapping.items():
+        value_type = type(value)
+        if value_type is dict or (
+            value_type not in _TERMINAL_TYPES and isinstance(value, Mapping)
+        ):
+            sub_mapping = map_leaves(value, fn)
+            if sub_mapping:
+                ret[key] = sub_mapping
+        else:
+            ret[key] = fn(value)
+    return ret
+
+
 def recursive_update(mapping: Mapping, other: Mapping) -> None:
     """Recursively update `mapping` using the terminal values from `other`.
 
-    Creates sub-mappings if they don't yet exist.
+    Creates sub-mappings if they don't yet exist. Like `walk_dict`, empty sub-mappings
+    of `other` hold no terminal values and so add nothing to `mapping`.
     """
-    for key_list, value in walk_dict(other):
-        set_nested(mapping, key_list, value)
+    for key, value in other.items():
+        value_type = type(value)
+        if value_type is not dict and (
+            value_type in _TERMINAL_TYPES or not isinstance(value, Mapping)
+        ):
+            mapping[key] = value
+            continue
+        child = mapping.get(key)
+        if type(child) is dict or isinstance(child, Mapping):
+            recursive_update(child, value)
+        elif value:
+            child = dict()
+            recursive_update(child, value)
+            if child:
+                mapping[key] = child
+
+
+def is_hollow(value: Any) -> bool:
+    """Return true if `value` is a mapping without any terminal values."""
+    if type(value) is not dict and not isinstance(value, Mapping):
+        return False
+    return all(is_hollow(v) for v in value.values())
 
 
 def flatten_dict(
@@ -5,18 +5,25 @@ import os
 import re
 
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from subprocess import run
 from shutil import rmtree
 from typing import Optional
 from uuid import uuid4
 
-import click
+try:
+    import pygit2
+except ImportError:  # pygit2 is an optional speedup.
+    pygit2 = None
 
+from tutor_recon.override.main import main_config_session
 from tutor_recon.override.module import OverrideModule
 from tutor_recon.override.reference import OverrideReference
 
-from .cli import emit, emit_critical
+from . import serialization, vjson
+from .cli import emit, emit_critical, style
+from .constants import MODULES_SUBDIR
 
 
 @contextmanager
@@ -30,8 +37,15 @@ def chdir(to: Path) -> iter:
         os.chdir(prev)
 
 
+INIT_COMMIT_MESSAGE = "[recon] Create new module repository."
+
+
 def init_repo(parent_dir: Path, name: str, url: str, push: bool = False) -> None:
-    """Create a git repository for a module."""
+    """Create a git repository for a module.
+
+    Uses the `git` executable rather than `pygit2`, so that the user's identity (including
+    `GIT_AUTHOR_*` and `GIT_COMMITTER_*` variables), hooks and credentials apply.
+    """
     module_root = parent_dir / name
     module_root.mkdir(parents=True, exist_ok=True)
     with chdir(module_root):
@@ -39,7 +53,7 @@ def init_repo(parent_dir: Path, name: str, url: str, push: bool = False) -> None
             readme.write(f"# {name}\n")
         run(["git", "init"])
         run(["git", "add", "README.md"])
-        run(["git", "commit", "-m", "[recon] Create new module repository."])
+        run(["git", "commit", "-m", INIT_COMMIT_MESSAGE])
         run(["git", "branch", "-M", "main"])
         if url:
             run(["git", "remote", "add", "origin", url])
@@ -47,23 +61,43 @@ def init_repo(parent_dir: Path, name: str, url: str, push: bool = False) -> None
             run(["git", "push", "-u", "origin", "main"])
 
 
-def clone_repo(url: str, to: Path, name: str = "") -> None:
-    """Clone a git repository into `to / name` from `url`.
+def clone_repo(url: str, to: Path, name: str = "") -> bool:
+    """Clone a git repository into `to / name` from `url`. Return true on success.
 
     If `name` is not provided, uses the default name of the repository.
+
+    The clone is partial (`--filter=blob:none`): only the blobs needed to check out
+    the default branch are fetched, in a single batch, rather than every blob in the
+    repository's history. Servers without partial clone support ignore the filter
+    and serve a full clone.
     """
     to.mkdir(parents=True, exist_ok=True)
-    cmd = ["git", "clone", url]
+    cmd = ["git", "clone", "--filter=blob:none", url]
     if name:
         cmd.append(name)
     with chdir(to):
-        run(cmd)
+        return run(cmd).returncode == 0
+
 
+def pull_repo(loc: Path) -> "tuple[bool, str]":
+    """Execute 'git pull' from `loc`.
 
-def pull_repo(loc: Path) -> None:
-    """Execute 'git pull' from `loc`."""
+    Returns:
+        A tuple of (whether HEAD moved, the new HEAD commit's SHA).
+    """
     with chdir(loc):
+        prev_sha = _head_sha()
         run(["git", "pull"])
+        new_sha = _head_sha()
+    return new_sha != prev_sha, new_sha
+
+
+def _head_sha() -> str:
+    if pygit2 is not None:
+        return str(pygit2.Repository(".").head.target)
+    return run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True
+    ).stdout.strip()
 
 
 def abort_if_exists(modules_root: Path, module_name: str) -> None:
@@ -89,8 +123,7 @@ def load_info(
     info = dict() if defaults is None else defaults
     info_path = module_dir / "module-info.json"
     try:
-        with open(info_path, "r") as f:
-            info.update(json.load(fp=f))
+        info.update(_read_info(info_path, os.stat(info_path).st_mtime_ns))
     except FileNotFoundError:
         if nofail:
             with open(info_path, "w") as new_file:
@@ -100,21 +133,40 @@ def load_info(
     return info
 
 
+@lru_cache(maxsize=8)
+def _read_info(info_path: Path, mtime_ns: int) -> "dict[str, str]":
+    """Parse a 'module-info.json', memoized on its modification time."""
+    return serialization.loads(info_path.read_bytes())
+
+
 def add_module(modules_root: Path, git_url: str) -> OverrideReference:
     """Add a module under `modules_root` from the given `git_url`.
 
-    Renames the module according to its `module-info.json` if possible. If the file
-    is missing, it is created and default values are added.
+    The repository is cloned into a pending directory under `modules_root` and then
+    moved into place according to its `module-info.json` if possible. If the file
+    is missing, it is created and default values are added. The pending clone is
+    removed if the module can't be added, and the pending directory once it is empty.
     """
     repo_name = str(uuid4())
-    module_dir = modules_root / repo_name
-    clone_repo(git_url, to=modules_root, name=repo_name)
-    emit(f"Cloned module to {click.style(module_dir, fg='yellow')}.")
-    endpoint_name = re.findall(r"([^/]).git", git_url)[0]
-    info = load_info(module_dir, defaults=dict(name=endpoint_name, version="unknown"))
-    full_name = info["name"]
-    abort_if_exists(modules_root, full_name)
-    module_dir.rename(module_dir.parent / full_name)
+    pending_root = modules_root / ".pending"
+    module_dir = pending_root / repo_name
+    try:
+        if not clone_repo(git_url, to=pending_root, name=repo_name):
+            emit_critical(message=f"Failed to clone '{git_url}'.", exit=True)
+        emit(f"Cloned module to {style(module_dir, fg='yellow')}.")
+        endpoint_name = re.search(r"([^/:]+?)(?:\.git)?/*$", git_url).group(1)
+        info = load_info(
+            module_dir, defaults=dict(name=endpoint_name, version="unknown")
+        )
+        full_name = info["name"]
+        abort_if_exists(modules_root, full_name)
+        module_dir.rename(modules_root / full_name)
+    finally:
+        rmtree(module_dir, ignore_errors=True)
+        try:
+            pending_root.rmdir()
+        except OSError:  # Another add is in progress, or the directory is already gone.
+            pass
     emit(f"Renamed '{repo_name}' -> '{full_name}'")
     return get_reference(modules_root, full_name)
 
@@ -128,6 +180,13 @@ def get_reference(modules_root: Path, name: str) -> OverrideReference:
     return OverrideReference(override=module)
 
 
+def disable_module(recon_root: Path, name: str) -> None:
+    """Remove the module of the given name from the main config, keeping its files."""
+    module = OverrideModule.by_name(name, recon_root / MODULES_SUBDIR)
+    with main_config_session(recon_root) as main:
+        main.remove_where(**vjson.expand_references(module.to_object()))
+
+
 def remove_module(modules_root: Path, name: str) -> None:
     """Delete the repository corresponding the module of the given name."""
     rmtree(modules_root / name, ignore_errors=True)
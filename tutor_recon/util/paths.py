@@ -1,21 +1,65 @@
 """Path-related utilities."""
 
+import os
+import shutil
+
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from uuid import uuid4
 
 import click
 import cloup
 
 
+def atomic_write(path: Path, data: bytes) -> None:
+    """Replace the contents of `path` with `data` so that readers never see a partial file.
+
+    The data is written to a temporary file beside `path`, which is then renamed over it.
+    The permission bits of an existing file are kept.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp.write_bytes(data)
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically replace the contents of `path` with `data`, unless they're equal already.
+
+    Skipping identical writes leaves the file's modification time alone, so caches keyed
+    on it stay valid.
+
+    Returns:
+        Whether the file was written.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
 def set_overrides_path(tutor_root: Path, new_path: Path) -> Path:
     """Store a string representation of `new_path` in `tutor_root / '.recon'`.
 
     Returns:
-        The value of `new_path`.
+        The value of `new_path`, resolved to an absolute path.
     """
-    new_path_str = str(new_path.resolve())
+    new_path = new_path.resolve()
     with open(tutor_root / ".recon", "w") as f:
-        f.write(new_path_str)
+        f.write(str(new_path))
+    _root_dirs.cache_clear()
     return new_path
 
 
@@ -41,4 +85,9 @@ def overrides_path(tutor_root: Path, env_dir: Optional[Path] = None) -> Path:
 
 def root_dirs(context: cloup.Context) -> "tuple[Path, Path]":
     """Return (tutor_root, recon_root) as determined using the given `Context`."""
-    return Path(context.obj.root), overrides_path(context.obj.root)
+    return _root_dirs(str(context.obj.root))
+
+
+@lru_cache(maxsize=4)
+def _root_dirs(tutor_root: str) -> "tuple[Path, Path]":
+    return Path(tutor_root), overrides_path(tutor_root)
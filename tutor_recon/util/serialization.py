@@ -0,0 +1,44 @@
+"""JSON (de)serialization backed by `orjson` when it is installed, or the standard library otherwise."""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup.
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse the given JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False
+) -> str:
+    """Serialize `obj` to a JSON string, compact unless `indent` is set (two spaces per level).
+
+    `default` is called on objects which can't otherwise be serialized, as with `json.dumps`.
+    Unlike `json.dumps`, non-ASCII characters are written as-is, so the output is the same
+    whether or not `orjson` is installed.
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, default=default, indent=indent).decode()
+    if indent:
+        return json.dumps(obj, default=default, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps_bytes(
+    obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False
+) -> bytes:
+    """Like `dumps`, but return UTF-8 encoded bytes."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return dumps(obj, default=default, indent=indent).encode()
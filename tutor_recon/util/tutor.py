@@ -1,13 +1,86 @@
 """Re-exports of Tutor commands and tutor-related utility functions are added to this file as needed."""
 
+import hashlib
+from importlib import metadata
+import os
+from pathlib import Path
+from typing import Optional
+
 import cloup
-import tutor.commands.config
-from .constants import CONFIG_SAVE_STYLED
+from tutor.__about__ import __version__ as tutor_version
+from tutor import config as tutor_config
+from tutor import env as tutor_env
+from .constants import config_save_styled
 from .cli import emit
 
-tutor_config_save = tutor.commands.config.save
+LAST_SAVE_FILE = ".recon_last_tutor_save"
+
+
+def run_tutor_config_save(
+    context: cloup.Context, recon_root: Optional[Path] = None
+) -> Optional[dict]:
+    """Do the equivalent of `tutor config save`, unless nothing has changed since the last run.
+
+    The save is skipped if the Tutor version, the installed plugin versions, `config.yml`
+    and (if `recon_root` is given) every override file under `recon_root` all match the
+    digest recorded after the previous save.
+
+    Returns:
+        The complete configuration which was rendered to the environment, defaults included,
+        or None if the save was skipped.
+    """
+    root = Path(context.obj.root)
+    stamp = root / LAST_SAVE_FILE
+    if (root / "env").is_dir() and _read_bytes(stamp).decode() == _config_digest(
+        root, recon_root
+    ):
+        emit(f"Skipping {config_save_styled()} (cached).")
+        return None
+    emit(f"Running {config_save_styled()}.")
+    config, defaults = tutor_config.load_all(str(root))
+    tutor_config.save_config_file(str(root), config)
+    tutor_config.merge(config, defaults)
+    tutor_env.save(str(root), config)
+    stamp.write_text(_config_digest(root, recon_root))
+    return config
+
+
+def _config_digest(tutor_root: Path, recon_root: Optional[Path]) -> str:
+    digest = hashlib.blake2b(tutor_version.encode(), digest_size=16)
+    for plugin in _installed_plugins():
+        digest.update(b"\0" + plugin.encode())
+    digest.update(b"\0")
+    digest.update(_read_bytes(tutor_root / "config.yml"))
+    if recon_root is not None:
+        # Overrides may reference any file under the recon root, so all of them are
+        # fingerprinted by path, size and modification time (hidden directories aside).
+        for path in _override_files(recon_root):
+            stat = path.stat()
+            digest.update(
+                f"\0{path.relative_to(recon_root)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+    return digest.hexdigest()
+
+
+def _installed_plugins() -> "list[str]":
+    """Return the name and version of each installed distribution providing Tutor plugins."""
+    plugins = set()
+    for dist in metadata.distributions():
+        if any(ep.group == "tutor.plugin.v0" for ep in dist.entry_points):
+            plugins.add(f"{dist.metadata['Name']}=={dist.version}")
+    return sorted(plugins)
+
+
+def _override_files(recon_root: Path) -> "list[Path]":
+    files = []
+    for dirpath, dirnames, filenames in os.walk(recon_root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        files.extend(Path(dirpath, f) for f in filenames if not f.startswith("."))
+    return sorted(files)
 
 
-def run_tutor_config_save(context: cloup.Context) -> None:
-    emit(f"Running {CONFIG_SAVE_STYLED}.")
-    context.invoke(tutor_config_save)
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return b""
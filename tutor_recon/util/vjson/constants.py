@@ -2,6 +2,9 @@ from typing import Literal, Union
 
 MARKER = "$"
 
+TYPE_KEY = f"{MARKER}t"
+"""The key under which a custom object's type id is stored."""
+
 JSON_T = Union[str, int, float, bool, list, dict]
 """A type which can be represented in JSON."""
 
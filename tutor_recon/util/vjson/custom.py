@@ -4,7 +4,7 @@ from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Union, TYPE_CHECKING
 
-from .constants import MARKER, JSON_T
+from .constants import TYPE_KEY, JSON_T
 from .reference import RemoteMapping
 
 if TYPE_CHECKING:
@@ -26,6 +26,8 @@ class VJSONSerializableMixin(metaclass=ABCMeta):
     automatically (de)serializable.
     """
 
+    __slots__ = ("_target",)
+
     named_types = dict()
 
     def __init__(self, *args, **kwargs):
@@ -55,7 +57,7 @@ class VJSONSerializableMixin(metaclass=ABCMeta):
             mapping = RemoteMapping(remote_reference=self._target)
         else:
             mapping = dict()
-        mapping.update({f"{MARKER}t": self.type_id})
+        mapping[TYPE_KEY] = self.type_id
         return mapping
 
     @classmethod
@@ -1,8 +1,9 @@
 """The VJSONDecoder definition."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecoder
-from typing import Optional
+from typing import Any, Iterator, Optional
 from pathlib import Path
 from typing import Union
 
@@ -15,9 +16,14 @@ from .constants import (
     JSON_T,
     KEY_T,
     NOTHING,
+    TYPE_KEY,
 )
 from .custom import VJSON_T, VJSONSerializableMixin
 from .reference import RemoteMapping
+from .. import serialization
+
+PREFETCH_WORKERS = 8
+"""The maximum number of threads used to read referenced files ahead of decoding them."""
 
 
 class VJSONDecoder(JSONDecoder):
@@ -61,16 +67,81 @@ class VJSONDecoder(JSONDecoder):
         self._csm = {
             MARKER * 2: self.expand_escaped,
             f"{MARKER}#": self.expand_comment,
-            f"{MARKER}t": self.expand_custom_type,
+            TYPE_KEY: self.expand_custom_type,
             f"{MARKER}+": self.expand_object_reference,
             f"{MARKER}.": self.expand_relative,
             f"{MARKER}/": self.expand_absolute,
         }  # Stands for "control sequence mapping".
+        self._prefetched: "dict[Path, JSON_T]" = {}
 
     def params(self) -> dict:
         """Return a dictionary of all keyword arguments used to instantiate this object apart from `location`."""
         return self._params.copy()
 
+    def decode(self, s: str, *args, **kwargs) -> VJSON_T:
+        """Decode the document `s`, parsing it with `orjson` if available.
+
+        Every file referenced from `s` is read and parsed once up front (see
+        `prefetch_references`), however many times it is referenced. The standard library
+        parser and its hooks are used directly whenever extra decoder options were given.
+        """
+        if self._params:
+            return super().decode(s, *args, **kwargs)
+        data = serialization.loads(s)
+        self.prefetch_references(data)
+        return self.apply_object_hook(data)
+
+    def prefetch_references(self, data: JSON_T) -> None:
+        """Read and parse every file referenced (transitively) from `data` ahead of decoding.
+
+        Files are read concurrently, one level of nesting at a time. Missing or unreadable
+        files are skipped; they are handled as usual once decoding reaches them.
+        """
+        pending = list(dict.fromkeys(self._reference_targets(data, self.location)))
+        while pending:
+            if len(pending) == 1:
+                contents = [_read_json(pending[0])]
+            else:
+                workers = min(PREFETCH_WORKERS, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    contents = list(pool.map(_read_json, pending))
+            found = []
+            for path, content in zip(pending, contents):
+                if content is None:
+                    continue
+                self._prefetched[path] = content
+                found.extend(self._reference_targets(content, path.parent))
+            pending = [p for p in dict.fromkeys(found) if p not in self._prefetched]
+
+    def _reference_targets(
+        self, value: JSON_T, location: Optional[Path]
+    ) -> Iterator[Path]:
+        """Yield the path of every file reference among the object values within `value`."""
+        if type(value) is list:
+            for item in value:
+                yield from self._reference_targets(item, location)
+        elif type(value) is dict:
+            for v in value.values():
+                if type(v) is str:
+                    path = _reference_target(v, location)
+                    if path is not None:
+                        yield path
+                else:
+                    yield from self._reference_targets(v, location)
+
+    def apply_object_hook(self, value: JSON_T) -> VJSON_T:
+        """Call `object_hook` on every object within the parsed `value`, innermost first.
+
+        This matches the order in which `json` itself calls the hook while parsing.
+        """
+        if type(value) is dict:
+            return self.object_hook(
+                {k: self.apply_object_hook(v) for k, v in value.items()}
+            )
+        if type(value) is list:
+            return [self.apply_object_hook(v) for v in value]
+        return value
+
     def object_hook(self, obj: dict) -> dict:
         gen_expanded = (self.expand(pair) for pair in obj.items())
         ret = {k: v for k, v in gen_expanded if v is not IGNORE}
@@ -82,8 +153,8 @@ class VJSONDecoder(JSONDecoder):
     def expand_custom_type(
         self, value: JSON_T, key: KEY_T = NOTHING
     ) -> "tuple[CUSTOM_TYPE_T, VJSONSerializableMixin]":
-        assert key == f"{MARKER}t"
-        return CUSTOM_TYPE, VJSONSerializableMixin.by_type_id(value)
+        assert key == TYPE_KEY
+        return CUSTOM_TYPE, VJSONSerializableMixin.named_types[value]
 
     def expand_comment(self, value: JSON_T, key: KEY_T = NOTHING) -> IGNORE_T:
         """Return `IGNORE`."""
@@ -110,16 +181,25 @@ class VJSONDecoder(JSONDecoder):
 
         The file must contain a single JSON object.
         """
-        if not path.exists():
-            path.parent.mkdir(exist_ok=True, parents=True)
-            with open(path, "w") as f:
-                json.dump(dict(), fp=f)
-            return RemoteMapping(remote_reference=path)
-        with open(path, "r") as f:
-            data = json.load(f, cls=type(self), location=path.parent, **self.params())
+        if path in self._prefetched:
+            # Prefetching only keeps files which exist, so there's no need to check again.
+            decoder = type(self)(location=path.parent, **self.params())
+            decoder._prefetched = self._prefetched
+            data = decoder.apply_object_hook(self._prefetched[path])
+        else:
+            try:
+                source = path.read_bytes()
+            except FileNotFoundError:
+                path.parent.mkdir(exist_ok=True, parents=True)
+                with open(path, "w") as f:
+                    json.dump(dict(), fp=f)
+                return RemoteMapping(remote_reference=path)
+            data = json.loads(
+                source, cls=type(self), location=path.parent, **self.params()
+            )
         if isinstance(data, VJSONSerializableMixin):
             return data
-        return RemoteMapping(remote_reference=path, **data)
+        return RemoteMapping.from_dict(path, data)
 
     def expand_object_reference(
         self, value: str, key: KEY_T = NOTHING
@@ -182,14 +262,45 @@ class VJSONDecoder(JSONDecoder):
         parameter is provided. Likewise, they should return a tuple of both the expanded
         key and the original value if provided with both the `key` and `value` parameters.
         """
+        csm = self._csm
         k, v = pair
-        k2 = k[:2]
-        if k2 in self._csm:
-            k, v = self._csm[k2](v, key=k)
+        expand_key = csm.get(k[:2])
+        if expand_key is not None:
+            k, v = expand_key(v, key=k)
         if isinstance(v, str):
-            v2 = v[:2]
-            if v2 in self._csm:
-                v = self._csm[v2](v)
+            expand_value = csm.get(v[:2])
+            if expand_value is not None:
+                v = expand_value(v)
         elif isinstance(v, dict):
             v = self.object_hook(v)
         return k, v
+
+
+def _reference_target(value: str, location: Optional[Path]) -> Optional[Path]:
+    """Return the path referenced by the string value `value`, if it is a file reference.
+
+    This mirrors the resolution done by the `$+`, `$/` and `$.` expansion methods.
+    """
+    control, rest = value[:2], value[2:]
+    if control == f"{MARKER}+":
+        path = Path(rest)
+    elif control == f"{MARKER}/":
+        path = Path("/") / rest
+    elif control == f"{MARKER}.":
+        path = Path(rest)
+        if path.is_absolute():
+            path = path.relative_to(Path("/"))
+    else:
+        return None
+    if path.is_absolute():
+        return path
+    if location is None:
+        return None
+    return location / path
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return serialization.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
@@ -21,6 +21,7 @@ class VJSONEncoder(JSONEncoder):
         write_remote_mappings: bool = False,
         expand_remote_mappings: bool = False,
         prefer_relative_references: bool = True,
+        pending_writes: "Optional[dict[Path, str]]" = None,
         **kwargs,
     ) -> None:
         """
@@ -32,6 +33,9 @@ class VJSONEncoder(JSONEncoder):
                 to remote references directly in the output file.
             prefer_relative_references (bool): Always write out relative references when possible.
                 Has no effect if `location` is not set.
+            pending_writes (dict): If given along with `write_remote_mappings`, the files corresponding
+                to remote references are encoded into this dict (by path) instead of being written,
+                so that the caller can write them all once encoding has succeeded.
         **kwargs:
             Passed to `super().__init__`.
         """
@@ -39,6 +43,7 @@ class VJSONEncoder(JSONEncoder):
         self.expand_remote_mappings = expand_remote_mappings
         self.prefer_relative_references = prefer_relative_references
         self.location = location
+        self.pending_writes = pending_writes
         kwargs.pop("location", None)
         self._params = kwargs.copy()
         super().__init__(**kwargs)
@@ -50,7 +55,10 @@ class VJSONEncoder(JSONEncoder):
     def default(self, o: VJSON_T) -> JSON_T:
         if isinstance(o, RemoteReferenceMixin):
             if self.write_remote_mappings:
-                o.write(type(self), location=self.location, **self.params())
+                if self.pending_writes is None:
+                    o.write(type(self), location=self.location, **self.params())
+                else:
+                    self._encode_remote(o)
             if self.expand_remote_mappings:
                 return o.expand()
             if self.location and self.prefer_relative_references:
@@ -59,3 +67,14 @@ class VJSONEncoder(JSONEncoder):
         if isinstance(o, VJSONSerializableMixin):
             return o.to_object()
         return super().default(o)
+
+    def _encode_remote(self, o: RemoteReferenceMixin) -> None:
+        """Add the file for `o` (and any it references in turn) to `self.pending_writes`."""
+        target = o.target_path(self.location)
+        encoder = type(self)(
+            location=target.parent,
+            write_remote_mappings=True,
+            pending_writes=self.pending_writes,
+            **self.params(),
+        )
+        self.pending_writes[target] = encoder.encode(o.expand()) + "\n"
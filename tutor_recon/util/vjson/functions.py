@@ -1,15 +1,18 @@
 """Functional interface similar to that of the builtin `json` module."""
 
+from functools import lru_cache
 from io import FileIO
 import json
 from json.encoder import JSONEncoder
 from pathlib import Path
 from shutil import copy
-from typing import MutableMapping, Optional
+from typing import Iterator, MutableMapping, Optional
 
 from .decoder import VJSONDecoder
 from .encoder import VJSONEncoder
+from .constants import JSON_T
 from .custom import VJSON_T
+from ..paths import write_if_changed
 from ..cli import emit_critical, emit_warning
 
 
@@ -17,8 +20,9 @@ def load(source: Path, location: Path = None, **kwargs) -> MutableMapping:
     """Load the object stored at `source` using a VJSONDecoder."""
     if location is None:
         location = source.parent
-    with open(source, "r") as f:
-        return json.load(f, cls=VJSONDecoder, location=location, **kwargs)
+    return json.loads(
+        Path(source).read_bytes(), cls=VJSONDecoder, location=location, **kwargs
+    )
 
 
 def loads(s: str, **kwargs) -> MutableMapping:
@@ -26,6 +30,16 @@ def loads(s: str, **kwargs) -> MutableMapping:
     return json.loads(s, cls=VJSONDecoder, **kwargs)
 
 
+def load_object(obj: JSON_T, **kwargs) -> MutableMapping:
+    """Decode the already-parsed JSON `obj` as `loads` would decode its serialized form.
+
+    `obj` itself is not modified. Keyword arguments are passed to the `VJSONDecoder`.
+    """
+    decoder = VJSONDecoder(**kwargs)
+    decoder.prefetch_references(obj)
+    return decoder.apply_object_hook(obj)
+
+
 def dump(
     obj: "MutableMapping[str, VJSON_T]",
     fp: Optional[FileIO] = None,
@@ -39,36 +53,58 @@ def dump(
     cls: Optional[JSONEncoder] = None,
     **kwargs,
 ) -> None:
-    """Dump the given object into the file specified by `dest` using a VJSONEncoder."""
+    """Dump the given object into the file specified by `dest` using a VJSONEncoder.
+
+    When writing to `dest`, the file is replaced atomically (and left untouched if its
+    content wouldn't change), so `backup` only applies when an open `fp` is given.
+    """
     backup_path = None
-    close_file = False
     if fp is None:
-        fp = open(dest, "w")
-        close_file = True
+        dest = Path(dest)
     else:
         dest = Path(fp.name)
     if cls is None:
         cls = VJSONEncoder
     if location is None:
         location = dest.parent
-    if backup:
+    if backup and fp is not None:
         backup_path = Path(str(dest) + backup)
         copy(dest, backup_path)
+    pending_writes = dict()
+    if cls is VJSONEncoder and write_remote_mappings:
+        kwargs["pending_writes"] = pending_writes
     try:
-        json.dump(
-            obj,
-            fp,
-            cls=cls,
-            indent=indent,
-            location=location,
-            write_remote_mappings=write_remote_mappings,
-            expand_remote_mappings=expand_remote_mappings,
-            **kwargs,
-        )
+        # Encode in full before writing so the file gets a single write rather than one per token.
+        if cls is VJSONEncoder:
+            text = dumps(
+                obj,
+                location=location,
+                write_remote_mappings=write_remote_mappings,
+                expand_remote_mappings=expand_remote_mappings,
+                indent=indent,
+                **kwargs,
+            )
+        else:
+            text = cls(
+                indent=indent,
+                location=location,
+                write_remote_mappings=write_remote_mappings,
+                expand_remote_mappings=expand_remote_mappings,
+                **kwargs,
+            ).encode(obj)
         if write_trailing_newline:
-            fp.write("\n")
+            text += "\n"
+        _write_all(pending_writes)
+        if fp is None:
+            write_if_changed(dest, text.encode())
+        else:
+            fp.write(text)
     except Exception as e:
-        if backup_path is not None:
+        if fp is None:
+            emit_warning(
+                f"An exception occurred while saving file '{dest}'. The file was left unchanged."
+            )
+        elif backup_path is not None:
             emit_warning(
                 f"An exception occurred while saving file '{dest}'. Restoring backup from '{backup_path}'."
             )
@@ -79,12 +115,54 @@ def dump(
             )
         raise IOError from e
     finally:
-        if close_file:
-            fp.close()
         if backup_path is not None:
             backup_path.unlink(missing_ok=True)
 
 
+def _write_all(files: "dict[Path, str]") -> None:
+    """Write the encoded `files` which have changed, creating each distinct parent directory once."""
+    for parent in {path.parent for path in files}:
+        parent.mkdir(exist_ok=True, parents=True)
+    for path, text in files.items():
+        write_if_changed(path, text.encode())
+
+
+@lru_cache(maxsize=8)
+def _cached_encoder(
+    location: Optional[Path],
+    write_remote_mappings: bool,
+    expand_remote_mappings: bool,
+    indent: Optional[int],
+) -> VJSONEncoder:
+    return VJSONEncoder(
+        location=location,
+        write_remote_mappings=write_remote_mappings,
+        expand_remote_mappings=expand_remote_mappings,
+        indent=indent,
+    )
+
+
+def _encoder(
+    location: Optional[Path],
+    write_remote_mappings: bool,
+    expand_remote_mappings: bool,
+    indent: Optional[int],
+    **kwargs,
+) -> VJSONEncoder:
+    """Return a VJSONEncoder with the given settings, reusing one when no extra options are given."""
+    if kwargs:
+        return VJSONEncoder(
+            location=location,
+            write_remote_mappings=write_remote_mappings,
+            expand_remote_mappings=expand_remote_mappings,
+            indent=indent,
+            **kwargs,
+        )
+    return _cached_encoder(
+        location, write_remote_mappings, expand_remote_mappings, indent
+    )
+
+
 def dumps(
     obj: "MutableMapping[str, VJSON_T]",
     location: Path = None,
@@ -94,12 +172,22 @@ def dumps(
     **kwargs,
 ) -> str:
     """Dump the given object as a VJSON-formatted string."""
-    return json.dumps(
-        obj,
-        cls=VJSONEncoder,
-        indent=indent,
-        location=location,
-        write_remote_mappings=write_remote_mappings,
-        expand_remote_mappings=expand_remote_mappings,
-        **kwargs,
+    encoder = _encoder(
+        location, write_remote_mappings, expand_remote_mappings, indent, **kwargs
+    )
+    return encoder.encode(obj)
+
+
+def iterdumps(
+    obj: "MutableMapping[str, VJSON_T]",
+    location: Path = None,
+    write_remote_mappings: bool = True,
+    expand_remote_mappings: bool = False,
+    indent: Optional[int] = 4,
+    **kwargs,
+) -> Iterator[str]:
+    """Like `dumps`, but yield the output in chunks as it is produced rather than as a single string."""
+    encoder = _encoder(
+        location, write_remote_mappings, expand_remote_mappings, indent, **kwargs
     )
+    return encoder.iterencode(obj)
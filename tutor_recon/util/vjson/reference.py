@@ -3,7 +3,7 @@ from json import JSONEncoder
 from pathlib import Path
 from typing import MutableMapping, Optional
 
-from .util import WrappedDict, set_nested, walk_dict
+from .util import WrappedDict, map_leaves
 from .constants import JSON_T, MARKER
 
 
@@ -38,6 +38,16 @@ class RemoteReferenceMixin(ABC):
             return self._target_absolute()
         return self._target_relative()
 
+    def target_path(self, location: Optional[Path] = None) -> Path:
+        """The path of the referenced file, taking relative references from `location`."""
+        target = self.remote_reference
+        if not target.is_absolute():
+            assert (
+                location
+            ), f"Cannot write to relative path '{target}' without a location specified."
+            target = location / target
+        return target
+
     def _target_relative(self, to: Path = None) -> str:
         if to is not None:
             return f"{MARKER}+{self.remote_reference.relative_to(to)}"
@@ -60,12 +70,7 @@ class RemoteReferenceMixin(ABC):
         # We use .functions.dump here for consistency w/ api changes, but must avoid a circular import.
         from .functions import dump
 
-        target = self.remote_reference
-        if not target.is_absolute():
-            assert (
-                location
-            ), f"Cannot write to relative path '{target}' without a location specified."
-            target = location / target
+        target = self.target_path(location)
         target.parent.mkdir(exist_ok=True, parents=True)
         dump(
             self.expand(), dest=target, cls=serializer, location=target.parent, **kwargs
@@ -78,16 +83,27 @@ class RemoteMapping(RemoteReferenceMixin, WrappedDict):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_dict(cls, remote_reference: Path, data: dict) -> "RemoteMapping":
+        """Construct a `RemoteMapping` which wraps `data` itself rather than a copy of it.
+
+        Unlike passing the items as keyword arguments, this also allows keys which clash
+        with the constructor's parameters (e.g. `"remote_reference"`).
+        """
+        instance = cls(remote_reference=remote_reference)
+        instance._dict = data
+        return instance
+
     def expand(self) -> dict:
         return self._dict
 
 
 def expand_references(mapping: MutableMapping) -> dict:
     """Recursively expand any remote references within `mapping`."""
-    ret = dict()
-    for keys, val in walk_dict(mapping):
-        if isinstance(val, RemoteReferenceMixin):
-            set_nested(ret, keys, val.expand())
-        else:
-            set_nested(ret, keys, val)
-    return ret
+    return map_leaves(mapping, _expand_leaf)
+
+
+def _expand_leaf(value: JSON_T) -> JSON_T:
+    if isinstance(value, RemoteReferenceMixin):
+        return value.expand()
+    return value